@@ -68,6 +68,18 @@ class Config:
     )
     CACHE_REDIS_URL: str = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
     CACHE_REDIS_PREFIX: str = os.getenv("CACHE_REDIS_PREFIX", "trabajo-ia")
+    # Per-namespace entry bound for the in-memory backend (0 = unbounded)
+    CACHE_MAX_ENTRIES_PER_NAMESPACE: int = max(
+        0, _safe_int(os.getenv("CACHE_MAX_ENTRIES_PER_NAMESPACE"), 2048)
+    )
+    # Namespaces whose cached FRED responses are kept as compressed JSON bytes
+    CACHE_COMPRESSED_NAMESPACES: Tuple[str, ...] = tuple(
+        namespace.strip().lower()
+        for namespace in os.getenv(
+            "CACHE_COMPRESSED_NAMESPACES", "observations,gdp_series,category_series"
+        ).split(",")
+        if namespace.strip()
+    )
     CACHE_NAMESPACE_DEFAULTS: Dict[str, Optional[int]] = {
         "search_series": 300,
         "search_series_tags": 300,
@@ -81,6 +93,7 @@ class Config:
         "category_children": 3600,
         "category_related": 3600,
         "observations": 600,
+        "gdp_series": 86400,
     }
 
     # Rate Limiter Configuration
@@ -99,6 +112,10 @@ class Config:
     METRICS_ENABLED: bool = _str_to_bool(os.getenv("METRICS_ENABLED"), default=True)
     METRICS_EXPORT_FORMAT: str = os.getenv("METRICS_EXPORT_FORMAT", "json")
 
+    # Workflow Configuration
+    # Store fetched GDP observations as float32 (half the memory, ~7 significant digits)
+    GDP_FLOAT32: bool = _str_to_bool(os.getenv("GDP_FLOAT32"), default=False)
+
     @classmethod
     def validate(cls) -> None:
         """
@@ -12,7 +12,7 @@ from trabajo_ia_server.config import config
 from trabajo_ia_server.tools.fred.search_series import search_fred_series
 from trabajo_ia_server.tools.fred.get_tags import get_fred_tags
 from trabajo_ia_server.tools.fred.related_tags import search_fred_related_tags
-from trabajo_ia_server.tools.fred.series_by_tags import get_series_by_tags
+from trabajo_ia_server.tools.fred.series_by_tags import aget_series_by_tags
 from trabajo_ia_server.tools.fred.search_series_tags import search_series_tags
 from trabajo_ia_server.tools.fred.search_series_related_tags import search_series_related_tags
 from trabajo_ia_server.tools.fred.get_series_tags import get_series_tags
@@ -219,7 +219,7 @@ def search_related_tags(
 
 
 @mcp.tool("get_fred_series_by_tags")
-def get_series_by_tags_tool(
+async def get_series_by_tags_tool(
     tag_names: str,
     exclude_tag_names: Optional[str] = None,
     limit: int = 20,
@@ -279,7 +279,7 @@ def get_series_by_tags_tool(
         >>> get_series_by_tags_tool("employment;usa;nsa", limit=10, order_by="popularity", sort_order="desc")
     """
     logger.info(f"Fetching series by tags: '{tag_names}' (exclude: '{exclude_tag_names}')")
-    return get_series_by_tags(
+    return await aget_series_by_tags(
         tag_names=tag_names,
         exclude_tag_names=exclude_tag_names,
         limit=limit,
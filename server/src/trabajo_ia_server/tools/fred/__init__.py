@@ -6,7 +6,7 @@ Tools for interacting with the FRED API.
 from trabajo_ia_server.tools.fred.search_series import search_fred_series
 from trabajo_ia_server.tools.fred.get_tags import get_fred_tags
 from trabajo_ia_server.tools.fred.related_tags import search_fred_related_tags
-from trabajo_ia_server.tools.fred.series_by_tags import get_series_by_tags
+from trabajo_ia_server.tools.fred.series_by_tags import aget_series_by_tags, get_series_by_tags
 from trabajo_ia_server.tools.fred.search_series_tags import search_series_tags
 from trabajo_ia_server.tools.fred.search_series_related_tags import search_series_related_tags
 from trabajo_ia_server.tools.fred.get_series_tags import get_series_tags
@@ -19,6 +19,7 @@ __all__ = [
     "get_fred_tags",
     "search_fred_related_tags",
     "get_series_by_tags",
+    "aget_series_by_tags",
     "search_series_tags",
     "search_series_related_tags",
     "get_series_tags",
@@ -6,7 +6,7 @@ Get observations or data values for an economic data series.
 import json
 import logging
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Any, Dict, Literal, Optional
 
 from trabajo_ia_server.config import config
 from trabajo_ia_server.utils.fred_client import (
@@ -137,10 +137,7 @@ def get_series_observations(
         )
     """
     try:
-        # 1. Obtain API key
-        api_key = config.get_fred_api_key()
-
-        # 2. Validate series_id
+        # 1. Validate series_id
         if not series_id or not series_id.strip():
             error_msg = "Invalid series ID: series_id cannot be empty"
             logger.error(error_msg)
@@ -149,91 +146,20 @@ def get_series_observations(
                 "error": error_msg,
             }, separators=(",", ":"))
 
-        # 3. Validate and clamp limit
-        limit = max(1, min(limit, 100000))
-
-        # 4. Build base parameters
-        params = {
-            "api_key": api_key,
-            "series_id": series_id.strip(),
-            "file_type": "json",
-            "limit": limit,
-            "offset": offset,
-            "sort_order": sort_order,
-            "units": units,
-            "aggregation_method": aggregation_method,
-            "output_type": output_type,
-        }
-
-        # 5. Add optional date parameters
-        if observation_start:
-            params["observation_start"] = observation_start
-        if observation_end:
-            params["observation_end"] = observation_end
-        if realtime_start:
-            params["realtime_start"] = realtime_start
-        if realtime_end:
-            params["realtime_end"] = realtime_end
-
-        # 6. Add frequency aggregation if specified
-        if frequency:
-            params["frequency"] = frequency
-
-        # 7. Log operation
-        date_range = ""
-        if observation_start or observation_end:
-            start = observation_start or "earliest"
-            end = observation_end or "latest"
-            date_range = f" ({start} to {end})"
-
-        transform = f" with {units} transformation" if units != "lin" else ""
-        freq = f", aggregated to {frequency}" if frequency else ""
-
-        logger.info(
-            f"Fetching observations for series '{series_id}'{date_range}{transform}{freq}"
-        )
-
-        # 8. Make API request with retry
-        ttl = config.get_cache_ttl("observations", fallback=900)
-        response: FredAPIResponse = fred_client.get_json(
-            FRED_OBSERVATIONS_URL,
-            params,
-            namespace="observations",
-            ttl=ttl,
-        )
-        json_data = response.json()
-
-        # 9. Extract observations
-        observations = json_data.get("observations", [])
-
-        # 10. Build structured output
-        output = {
-            "tool": "get_series_observations",
-            "data": observations,
-            "metadata": {
-                "fetch_date": datetime.utcnow().isoformat() + "Z",
-                "series_id": series_id,
-                "realtime_start": json_data.get("realtime_start"),
-                "realtime_end": json_data.get("realtime_end"),
-                "observation_start": json_data.get("observation_start"),
-                "observation_end": json_data.get("observation_end"),
-                "units": json_data.get("units"),
-                "frequency": json_data.get("frequency"),
-                "aggregation_method": aggregation_method,
-                "output_type": json_data.get("output_type"),
-                "order_by": json_data.get("order_by", "observation_date"),
-                "sort_order": json_data.get("sort_order"),
-                "total_count": json_data.get("count", len(observations)),
-                "returned_count": len(observations),
-                "limit": limit,
-                "offset": offset,
-                "cache_hit": response.from_cache,
-            },
-        }
-
-        # 11. Log success
-        logger.info(
-            f"Retrieved {len(observations)} observations for series '{series_id}'"
+        # 2-11. Fetch and shape the observations
+        output = _fetch_observations_core(
+            series_id,
+            observation_start=observation_start,
+            observation_end=observation_end,
+            realtime_start=realtime_start,
+            realtime_end=realtime_end,
+            limit=limit,
+            offset=offset,
+            sort_order=sort_order,
+            units=units,
+            frequency=frequency,
+            aggregation_method=aggregation_method,
+            output_type=output_type,
         )
 
         # 12. Return compact JSON (AI-optimized)
@@ -267,3 +193,117 @@ def get_series_observations(
             "error": error_msg,
             "series_id": series_id if series_id else None,
         }, separators=(",", ":"))
+
+
+def _fetch_observations_core(
+    series_id: str,
+    *,
+    observation_start: Optional[str] = None,
+    observation_end: Optional[str] = None,
+    realtime_start: Optional[str] = None,
+    realtime_end: Optional[str] = None,
+    limit: int = 100000,
+    offset: int = 0,
+    sort_order: str = "asc",
+    units: str = "lin",
+    frequency: Optional[str] = None,
+    aggregation_method: str = "avg",
+    output_type: int = 1,
+) -> Dict[str, Any]:
+    """
+    Fetch observations and return the tool output as a dict.
+
+    In-process callers use this to skip the JSON encode/decode round trip of
+    :func:`get_series_observations`. Raises :class:`FredAPIError` on API failures.
+    """
+    # 2. Obtain API key
+    api_key = config.get_fred_api_key()
+
+    # 3. Validate and clamp limit
+    limit = max(1, min(limit, 100000))
+
+    # 4. Build base parameters
+    params: Dict[str, Any] = {
+        "api_key": api_key,
+        "series_id": series_id.strip(),
+        "file_type": "json",
+        "limit": limit,
+        "offset": offset,
+        "sort_order": sort_order,
+        "units": units,
+        "aggregation_method": aggregation_method,
+        "output_type": output_type,
+    }
+
+    # 5. Add optional date parameters
+    if observation_start:
+        params["observation_start"] = observation_start
+    if observation_end:
+        params["observation_end"] = observation_end
+    if realtime_start:
+        params["realtime_start"] = realtime_start
+    if realtime_end:
+        params["realtime_end"] = realtime_end
+
+    # 6. Add frequency aggregation if specified
+    if frequency:
+        params["frequency"] = frequency
+
+    # 7. Log operation
+    date_range = ""
+    if observation_start or observation_end:
+        start = observation_start or "earliest"
+        end = observation_end or "latest"
+        date_range = f" ({start} to {end})"
+
+    transform = f" with {units} transformation" if units != "lin" else ""
+    freq = f", aggregated to {frequency}" if frequency else ""
+
+    logger.info(
+        f"Fetching observations for series '{series_id}'{date_range}{transform}{freq}"
+    )
+
+    # 8. Make API request with retry
+    ttl = config.get_cache_ttl("observations", fallback=900)
+    response: FredAPIResponse = fred_client.get_json(
+        FRED_OBSERVATIONS_URL,
+        params,
+        namespace="observations",
+        ttl=ttl,
+    )
+    json_data = response.json()
+
+    # 9. Extract observations
+    observations = json_data.get("observations", [])
+
+    # 10. Build structured output
+    output = {
+        "tool": "get_series_observations",
+        "data": observations,
+        "metadata": {
+            "fetch_date": datetime.utcnow().isoformat() + "Z",
+            "series_id": series_id,
+            "realtime_start": json_data.get("realtime_start"),
+            "realtime_end": json_data.get("realtime_end"),
+            "observation_start": json_data.get("observation_start"),
+            "observation_end": json_data.get("observation_end"),
+            "units": json_data.get("units"),
+            "frequency": json_data.get("frequency"),
+            "aggregation_method": aggregation_method,
+            "output_type": json_data.get("output_type"),
+            "order_by": json_data.get("order_by", "observation_date"),
+            "sort_order": json_data.get("sort_order"),
+            "total_count": json_data.get("count", len(observations)),
+            "returned_count": len(observations),
+            "limit": limit,
+            "offset": offset,
+            "cache_hit": response.from_cache,
+        },
+    }
+
+    # 11. Log success
+    logger.info(
+        f"Retrieved {len(observations)} observations for series '{series_id}'"
+    )
+
+    return output
@@ -6,7 +6,7 @@ Get series that match ALL specified tags and NONE of the excluded tags.
 import json
 import logging
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Any, Dict, Literal, Optional, Tuple
 
 from trabajo_ia_server.config import config
 from trabajo_ia_server.utils.fred_client import (
@@ -20,6 +20,22 @@ logger = logging.getLogger(__name__)
 # FRED API endpoint for series by tags
 FRED_SERIES_BY_TAGS_URL = "https://api.stlouisfed.org/fred/tags/series"
 
+# Metadata field order for the tool response (values are zipped in per call)
+_METADATA_KEYS = (
+    "fetch_date",
+    "required_tags",
+    "excluded_tags",
+    "total_count",
+    "returned_count",
+    "limit",
+    "offset",
+    "order_by",
+    "sort_order",
+    "realtime_start",
+    "realtime_end",
+    "cache_hit",
+)
+
 
 def get_series_by_tags(
     tag_names: str,
@@ -135,30 +151,17 @@ def get_series_by_tags(
         )
     """
     try:
-        # 1. Obtain API key
-        api_key = config.get_fred_api_key()
-
-        # 2. Validate and clamp limit
-        limit = max(1, min(limit, 1000))
-
-        # 3. Build base parameters
-        params = {
-            "api_key": api_key,
-            "tag_names": tag_names,
-            "file_type": "json",
-            "limit": limit,
-            "offset": offset,
-            "order_by": order_by,
-            "sort_order": sort_order,
-        }
-
-        # 4. Add optional parameters
-        if exclude_tag_names:
-            params["exclude_tag_names"] = exclude_tag_names
-        if realtime_start:
-            params["realtime_start"] = realtime_start
-        if realtime_end:
-            params["realtime_end"] = realtime_end
+        # 1-4. Build request parameters
+        params, limit = _build_params(
+            tag_names,
+            exclude_tag_names,
+            limit,
+            offset,
+            order_by,
+            sort_order,
+            realtime_start,
+            realtime_end,
+        )
 
         # 5. Log operation
         logger.info(
@@ -174,65 +177,190 @@ def get_series_by_tags(
             namespace="series_by_tags",
             ttl=ttl,
         )
-        json_data = response.json()
 
-        # 7. Extract series data (note: FRED uses "seriess" with double 's')
-        series_list = json_data.get("seriess", [])
+        # 7-10. Build compact JSON output
+        return _format_response(
+            response, tag_names, exclude_tag_names, limit, offset, order_by, sort_order
+        )
 
-        # 8. Build structured output
-        output = {
-            "tool": "get_series_by_tags",
-            "data": series_list,
-            "metadata": {
-                "fetch_date": datetime.utcnow().isoformat() + "Z",
-                "required_tags": tag_names.split(";"),
-                "excluded_tags": exclude_tag_names.split(";") if exclude_tag_names else None,
-                "total_count": json_data.get("count", len(series_list)),
-                "returned_count": len(series_list),
-                "limit": limit,
-                "offset": offset,
-                "order_by": order_by,
-                "sort_order": sort_order,
-                "realtime_start": json_data.get("realtime_start"),
-                "realtime_end": json_data.get("realtime_end"),
-                "cache_hit": response.from_cache,
-            },
-        }
+    except FredAPIError as e:
+        return _format_api_error(e, tag_names)
 
-        # 9. Log success
-        logger.info(f"Found {len(series_list)} series matching tags")
+    except Exception as e:
+        return _format_unexpected_error(e, tag_names)
 
-        # 10. Return compact JSON (AI-optimized)
-        return json.dumps(output, separators=(",", ":"), default=str)
 
-    except FredAPIError as e:
-        if e.status_code == 429:
-            error_msg = "Rate limit exceeded. Please try again later."
-        elif e.status_code == 400 and e.payload:
-            detail = e.payload.get("error_message")
-            error_msg = f"Invalid parameters: {detail}" if detail else "Invalid parameters provided"
-        else:
-            error_msg = f"FRED API error: {e.message}"
-
-        logger.error(error_msg)
-        return json.dumps(
-            {
-                "tool": "get_series_by_tags",
-                "error": error_msg,
-                "required_tags": tag_names.split(";"),
-            },
-            separators=(",", ":"),
+async def aget_series_by_tags(
+    tag_names: str,
+    exclude_tag_names: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    order_by: str = "series_id",
+    sort_order: Literal["asc", "desc"] = "asc",
+    realtime_start: Optional[str] = None,
+    realtime_end: Optional[str] = None,
+) -> str:
+    """
+    Async variant of :func:`get_series_by_tags`.
+
+    Shares the cache, rate limiter, and response format with the sync tool, so
+    several tag queries can run concurrently:
+
+        await asyncio.gather(*(aget_series_by_tags(t) for t in tag_queries))
+    """
+    try:
+        params, limit = _build_params(
+            tag_names,
+            exclude_tag_names,
+            limit,
+            offset,
+            order_by,
+            sort_order,
+            realtime_start,
+            realtime_end,
+        )
+
+        logger.info(
+            f"Fetching series with tags (async): '{tag_names}' "
+            f"(exclude: '{exclude_tag_names}', order: {order_by})"
+        )
+
+        ttl = config.get_cache_ttl("series_by_tags", fallback=300)
+        response: FredAPIResponse = await fred_client.get_json_async(
+            FRED_SERIES_BY_TAGS_URL,
+            params,
+            namespace="series_by_tags",
+            ttl=ttl,
         )
 
+        return _format_response(
+            response, tag_names, exclude_tag_names, limit, offset, order_by, sort_order
+        )
+
+    except FredAPIError as e:
+        return _format_api_error(e, tag_names)
+
     except Exception as e:
-        # Handle unexpected errors
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return json.dumps(
-            {
-                "tool": "get_series_by_tags",
-                "error": error_msg,
-                "required_tags": tag_names.split(";") if tag_names else [],
-            },
-            separators=(",", ":"),
+        return _format_unexpected_error(e, tag_names)
+
+
+def _build_params(
+    tag_names: str,
+    exclude_tag_names: Optional[str],
+    limit: int,
+    offset: int,
+    order_by: str,
+    sort_order: str,
+    realtime_start: Optional[str],
+    realtime_end: Optional[str],
+) -> Tuple[Dict[str, Any], int]:
+    """Build FRED request parameters; returns them with the clamped limit."""
+    # 1. Obtain API key
+    api_key = config.get_fred_api_key()
+
+    # 2. Validate and clamp limit
+    limit = max(1, min(limit, 1000))
+
+    # 3. Build base parameters
+    params: Dict[str, Any] = {
+        "api_key": api_key,
+        "tag_names": tag_names,
+        "file_type": "json",
+        "limit": limit,
+        "offset": offset,
+        "order_by": order_by,
+        "sort_order": sort_order,
+    }
+
+    # 4. Add optional parameters
+    if exclude_tag_names:
+        params["exclude_tag_names"] = exclude_tag_names
+    if realtime_start:
+        params["realtime_start"] = realtime_start
+    if realtime_end:
+        params["realtime_end"] = realtime_end
+
+    return params, limit
+
+
+def _format_response(
+    response: FredAPIResponse,
+    tag_names: str,
+    exclude_tag_names: Optional[str],
+    limit: int,
+    offset: int,
+    order_by: str,
+    sort_order: str,
+) -> str:
+    """Shape a FRED response into the tool's compact JSON output."""
+    json_data = response.json()
+
+    # 7. Extract series data (note: FRED uses "seriess" with double 's')
+    series_list = json_data.get("seriess", [])
+
+    # 8. Build structured output
+    metadata = dict(
+        zip(
+            _METADATA_KEYS,
+            (
+                datetime.utcnow().isoformat() + "Z",
+                tag_names.split(";"),
+                exclude_tag_names.split(";") if exclude_tag_names else None,
+                json_data.get("count", len(series_list)),
+                len(series_list),
+                limit,
+                offset,
+                order_by,
+                sort_order,
+                json_data.get("realtime_start"),
+                json_data.get("realtime_end"),
+                response.from_cache,
+            ),
+            strict=True,
         )
+    )
+    output = {
+        "tool": "get_series_by_tags",
+        "data": series_list,
+        "metadata": metadata,
+    }
+
+    # 9. Log success
+    logger.info(f"Found {len(series_list)} series matching tags")
+
+    # 10. Return compact JSON (AI-optimized)
+    return json.dumps(output, separators=(",", ":"), default=str)
+
+
+def _format_api_error(e: FredAPIError, tag_names: str) -> str:
+    if e.status_code == 429:
+        error_msg = "Rate limit exceeded. Please try again later."
+    elif e.status_code == 400 and e.payload:
+        detail = e.payload.get("error_message")
+        error_msg = f"Invalid parameters: {detail}" if detail else "Invalid parameters provided"
+    else:
+        error_msg = f"FRED API error: {e.message}"
+
+    logger.error(error_msg)
+    return json.dumps(
+        {
+            "tool": "get_series_by_tags",
+            "error": error_msg,
+            "required_tags": tag_names.split(";"),
+        },
+        separators=(",", ":"),
+    )
+
+
+def _format_unexpected_error(e: Exception, tag_names: str) -> str:
+    # Handle unexpected errors
+    error_msg = f"Unexpected error: {str(e)}"
+    logger.error(error_msg, exc_info=True)
+    return json.dumps(
+        {
+            "tool": "get_series_by_tags",
+            "error": error_msg,
+            "required_tags": tag_names.split(";") if tag_names else [],
+        },
+        separators=(",", ":"),
+    )
@@ -7,12 +7,17 @@ FRED API responses and other expensive operations.
 
 from __future__ import annotations
 
+import array
+import heapq
+import itertools
+import math
 import pickle
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, MutableMapping, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from trabajo_ia_server.config import config
 from trabajo_ia_server.utils.logger import setup_logger
@@ -30,17 +35,42 @@ try:  # pragma: no cover - optional dependency
 except ImportError:  # pragma: no cover - optional dependency not installed
     redis = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency
+    import cachebox  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency not installed
+    cachebox = None  # type: ignore
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CacheEntry:
-    """Container for cached values and their expiration metadata."""
+    """Container for cached values and their expiration metadata.
+
+    ``expires_at`` is a monotonic deadline; ``math.inf`` means never expires.
+    Kept for API compatibility: ``InMemoryCache`` stores packed
+    ``(expires_at, value)`` tuples instead to avoid per-entry instances.
+    """
 
     value: Any
-    expires_at: Optional[float]
+    expires_at: float = math.inf
+
+
+_MISSING = object()
+
+# Field order of the per-namespace counter arrays kept by CacheManager.
+_COUNTER_FIELDS = ("hits", "misses", "stores")
+_HITS, _MISSES, _STORES = range(len(_COUNTER_FIELDS))
+
+
+def _new_counters() -> "array.array[int]":
+    return array.array("Q", [0] * len(_COUNTER_FIELDS))
 
 
 class CacheBackend:
-    """Base cache backend interface."""
+    """Base cache backend interface.
+
+    Flat-key methods are required; the namespaced variants default to
+    ``"<namespace>:<key>"`` keys and may be overridden for cheaper isolation.
+    """
 
     enabled: bool = True
     default_ttl: Optional[int] = None
@@ -57,6 +87,28 @@ class CacheBackend:
     def clear(self, prefix: Optional[str] = None) -> None:  # pragma: no cover
         raise NotImplementedError
 
+    def get_in(self, namespace: str, key: str, default: Any = None) -> Any:
+        return self.get(f"{namespace}:{key}", default)
+
+    def get_with_hit(self, namespace: str, key: str) -> Tuple[Any, bool]:
+        """Return ``(value, True)`` on a hit or ``(None, False)`` on a miss."""
+
+        value = self.get_in(namespace, key, _MISSING)
+        if value is _MISSING:
+            return None, False
+        return value, True
+
+    def set_in(
+        self, namespace: str, key: str, value: Any, ttl: Optional[int] = None
+    ) -> None:
+        self.set(f"{namespace}:{key}", value, ttl)
+
+    def delete_in(self, namespace: str, key: str) -> None:
+        self.delete(f"{namespace}:{key}")
+
+    def clear_namespace(self, namespace: str) -> None:
+        self.clear(f"{namespace}:")
+
 
 class NullCache(CacheBackend):
     """Disabled cache backend used when caching is turned off."""
@@ -76,52 +128,303 @@ class NullCache(CacheBackend):
         return None
 
 
+class _Shard:
+    """Per-namespace entry table (in LRU order) with its own write lock."""
+
+    __slots__ = ("entries", "hits", "lock")
+
+    def __init__(self) -> None:
+        self.entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+
 class InMemoryCache(CacheBackend):
-    """Thread-safe in-memory cache with TTL support."""
+    """Thread-safe in-memory cache with TTL support.
+
+    Entries are sharded by namespace so invalidating a namespace is O(1) and
+    writers to different namespaces never contend on the same lock. A min-heap
+    of deadlines lets writes sweep expired entries that are never read again.
+
+    When ``max_entries`` is set, each namespace is bounded with a v-LRU policy:
+    among the least recently used tenth of entries, the one with the fewest
+    hits is evicted first.
+    """
 
-    def __init__(self, default_ttl: Optional[int] = None) -> None:
+    sweep_batch_size = 128
+
+    def __init__(
+        self, default_ttl: Optional[int] = None, max_entries: Optional[int] = None
+    ) -> None:
         self.default_ttl = default_ttl
-        self._store: MutableMapping[str, CacheEntry] = {}
-        self._lock = threading.RLock()
+        self.max_entries = max_entries if max_entries and max_entries > 0 else None
+        self._shards: Dict[str, _Shard] = {}
+        self._lock = threading.Lock()
+        self._expiry_heap: List[Tuple[float, str, str]] = []
+        self._expiry_lock = threading.Lock()
 
     def _now(self) -> float:
         return time.monotonic()
 
-    def _is_expired(self, entry: CacheEntry) -> bool:
-        return entry.expires_at is not None and entry.expires_at <= self._now()
+    @staticmethod
+    def _split(key: str) -> Tuple[str, str]:
+        namespace, sep, subkey = key.partition(":")
+        if not sep:
+            return "", key
+        return namespace, subkey
+
+    def _shard_for_write(self, namespace: str) -> _Shard:
+        shard = self._shards.get(namespace)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.setdefault(namespace, _Shard())
+        return shard
+
+    def get_with_hit(self, namespace: str, key: str) -> Tuple[Any, bool]:
+        # Lock-free read: dict.get is atomic under the GIL and entries are
+        # immutable, so a lock is only needed to evict an expired entry.
+        shard = self._shards.get(namespace)
+        if shard is None:
+            return None, False
+        entry = shard.entries.get(key)
+        if entry is None:
+            return None, False
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            with shard.lock:
+                # Only evict if a concurrent ``set`` has not replaced the entry.
+                if shard.entries.get(key) is entry:
+                    del shard.entries[key]
+                    shard.hits.pop(key, None)
+            return None, False
+        if self.max_entries is not None and shard.lock.acquire(blocking=False):
+            # Best-effort recency update: skipped rather than waiting on a writer.
+            try:
+                if key in shard.entries:
+                    shard.entries.move_to_end(key)
+                    shard.hits[key] = shard.hits.get(key, 0) + 1
+            finally:
+                shard.lock.release()
+        return value, True
+
+    def get_in(self, namespace: str, key: str, default: Any = None) -> Any:
+        value, hit = self.get_with_hit(namespace, key)
+        return value if hit else default
+
+    def set_in(
+        self, namespace: str, key: str, value: Any, ttl: Optional[int] = None
+    ) -> None:
+        effective_ttl = self.default_ttl if ttl is None else ttl
+        if effective_ttl is not None and effective_ttl <= 0:
+            return
+        expires_at = (
+            self._now() + effective_ttl if effective_ttl is not None else math.inf
+        )
+        shard = self._shard_for_write(namespace)
+        with shard.lock:
+            shard.entries[key] = (expires_at, value)
+            shard.entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(shard.entries) > self.max_entries:
+                    self._evict_locked(shard)
+        if expires_at != math.inf:
+            with self._expiry_lock:
+                heapq.heappush(self._expiry_heap, (expires_at, namespace, key))
+            if len(self._expiry_heap) > self.sweep_batch_size:
+                self._maybe_compact_expiry_heap()
+        heap = self._expiry_heap
+        if heap and heap[0][0] <= self._now():
+            self.sweep_expired(max_items=self.sweep_batch_size)
+
+    def _maybe_compact_expiry_heap(self) -> None:
+        """Rebuild the deadline heap once stale records outnumber live entries.
+
+        Overwrites, evictions and namespace clears leave their old records in
+        the heap until their deadline passes; rebuilding from the live shards
+        keeps it bounded by the cache size instead.
+        """
 
-    def get(self, key: str, default: Any = None) -> Any:
         with self._lock:
-            entry = self._store.get(key)
-            if entry is None:
-                return default
-            if self._is_expired(entry):
-                self._store.pop(key, None)
-                return default
-            return entry.value
+            shards = list(self._shards.items())
+        live = sum(len(shard.entries) for _, shard in shards)
+        if len(self._expiry_heap) <= 2 * live + self.sweep_batch_size:
+            return
+        # Writers push only after releasing their shard lock, so taking shard
+        # locks inside the expiry lock cannot deadlock; a write racing the
+        # rebuild pushes its record after the new heap is in place.
+        with self._expiry_lock:
+            heap: List[Tuple[float, str, str]] = []
+            for namespace, shard in shards:
+                with shard.lock:
+                    heap.extend(
+                        (expires_at, namespace, key)
+                        for key, (expires_at, _) in shard.entries.items()
+                        if expires_at != math.inf
+                    )
+            heapq.heapify(heap)
+            self._expiry_heap = heap
+
+    @staticmethod
+    def _evict_locked(shard: _Shard) -> None:
+        """Evict the least-hit entry among the oldest 10%; caller holds the lock."""
+
+        window = max(1, len(shard.entries) // 10)
+        candidates = itertools.islice(shard.entries, window)
+        # min() keeps the first (least recent) key on ties.
+        victim = min(candidates, key=lambda candidate: shard.hits.get(candidate, 0))
+        del shard.entries[victim]
+        shard.hits.pop(victim, None)
+
+    def sweep_expired(self, now: Optional[float] = None, max_items: int = 128) -> int:
+        """Drop up to ``max_items`` entries whose deadline has passed; return the count."""
+
+        now = self._now() if now is None else now
+        removed = 0
+        for _ in range(max_items):
+            with self._expiry_lock:
+                if not self._expiry_heap or self._expiry_heap[0][0] > now:
+                    break
+                _, namespace, key = heapq.heappop(self._expiry_heap)
+            shard = self._shards.get(namespace)
+            if shard is None:
+                continue
+            with shard.lock:
+                # The key may have been rewritten with a later deadline.
+                entry = shard.entries.get(key)
+                if entry is not None and entry[0] <= now:
+                    del shard.entries[key]
+                    shard.hits.pop(key, None)
+                    removed += 1
+        return removed
+
+    def delete_in(self, namespace: str, key: str) -> None:
+        shard = self._shards.get(namespace)
+        if shard is not None:
+            with shard.lock:
+                shard.entries.pop(key, None)
+                shard.hits.pop(key, None)
+
+    def clear_namespace(self, namespace: str) -> None:
+        with self._lock:
+            self._shards.pop(namespace, None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.get_in(*self._split(key), default)
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        namespace, subkey = self._split(key)
+        self.set_in(namespace, subkey, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self.delete_in(*self._split(key))
+
+    def clear(self, prefix: Optional[str] = None) -> None:
+        if prefix is None:
+            with self._lock:
+                self._shards.clear()
+            with self._expiry_lock:
+                self._expiry_heap.clear()
+            return
+        namespace, sep, rest = prefix.partition(":")
+        if sep and not rest:
+            self.clear_namespace(namespace)
+            return
+        with self._lock:
+            shards = list(self._shards.items())
+        for namespace, shard in shards:
+            with shard.lock:
+                keys_to_delete = [
+                    key
+                    for key in shard.entries
+                    if (f"{namespace}:{key}" if namespace else key).startswith(prefix)
+                ]
+                for key in keys_to_delete:
+                    shard.entries.pop(key, None)
+                    shard.hits.pop(key, None)
+
+
+class CacheboxBackend(CacheBackend):
+    """In-process cache backed by cachebox's Rust ``VTTLCache`` (one per namespace).
+
+    Lookups, per-entry TTL checks and locking run in native code, leaving only
+    the shard lookup in Python.
+    """
+
+    def __init__(self, default_ttl: Optional[int] = None, maxsize: int = 0) -> None:
+        if cachebox is None:  # pragma: no cover - defensive guard
+            raise RuntimeError(
+                "cachebox backend requested but the 'cachebox' package is not installed"
+            )
+
+        self.default_ttl = default_ttl
+        self._maxsize = maxsize
+        self._shards: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _shard_for_write(self, namespace: str) -> Any:
+        shard = self._shards.get(namespace)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.get(namespace)
+                if shard is None:
+                    shard = self._shards[namespace] = cachebox.VTTLCache(self._maxsize)
+        return shard
+
+    def get_with_hit(self, namespace: str, key: str) -> Tuple[Any, bool]:
+        shard = self._shards.get(namespace)
+        if shard is None:
+            return None, False
+        value = shard.get(key, _MISSING)
+        if value is _MISSING:
+            return None, False
+        return value, True
+
+    def get_in(self, namespace: str, key: str, default: Any = None) -> Any:
+        value, hit = self.get_with_hit(namespace, key)
+        return value if hit else default
+
+    def set_in(
+        self, namespace: str, key: str, value: Any, ttl: Optional[int] = None
+    ) -> None:
         effective_ttl = self.default_ttl if ttl is None else ttl
         if effective_ttl is not None and effective_ttl <= 0:
             return
-        expires_at = None
-        if effective_ttl is not None:
-            expires_at = self._now() + effective_ttl
+        self._shard_for_write(namespace).insert(key, value, effective_ttl)
+
+    def delete_in(self, namespace: str, key: str) -> None:
+        shard = self._shards.get(namespace)
+        if shard is not None:
+            shard.pop(key, None)
+
+    def clear_namespace(self, namespace: str) -> None:
         with self._lock:
-            self._store[key] = CacheEntry(value=value, expires_at=expires_at)
+            self._shards.pop(namespace, None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.get_in(*InMemoryCache._split(key), default)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        namespace, subkey = InMemoryCache._split(key)
+        self.set_in(namespace, subkey, value, ttl)
 
     def delete(self, key: str) -> None:
-        with self._lock:
-            self._store.pop(key, None)
+        self.delete_in(*InMemoryCache._split(key))
 
     def clear(self, prefix: Optional[str] = None) -> None:
+        if prefix is None:
+            with self._lock:
+                self._shards.clear()
+            return
+        namespace, sep, rest = prefix.partition(":")
+        if sep and not rest:
+            self.clear_namespace(namespace)
+            return
         with self._lock:
-            if prefix is None:
-                self._store.clear()
-                return
-            keys_to_delete = [key for key in self._store if key.startswith(prefix)]
-            for key in keys_to_delete:
-                self._store.pop(key, None)
+            shards = list(self._shards.items())
+        for namespace, shard in shards:
+            for key in list(shard.keys()):
+                if (f"{namespace}:{key}" if namespace else key).startswith(prefix):
+                    shard.pop(key, None)
 
 
 class DiskCacheBackend(CacheBackend):
@@ -216,8 +519,6 @@ class RedisCacheBackend(CacheBackend):
 class CacheManager:
     """High level cache manager with namespace isolation and metrics."""
 
-    _MISSING = object()
-
     def __init__(
         self,
         *,
@@ -231,42 +532,58 @@ class CacheManager:
         self.enabled = enabled and backend.enabled
         self.default_ttl = default_ttl if default_ttl is not None else backend.default_ttl
         self._namespace_ttls: Dict[str, Optional[int]] = {}
-        self._metrics: Dict[str, Dict[str, int]] = {}
+        self._resolved_ttls: Dict[str, Optional[int]] = {}
+        self._metrics: Dict[str, "array.array[int]"] = {}
+        self._normalized_names: Dict[str, str] = {}
         self._lock = threading.RLock()
 
+    def _norm(self, namespace: str) -> str:
+        """Return the normalized namespace, memoized to avoid per-call allocation."""
+
+        normalized = self._normalized_names.get(namespace)
+        if normalized is None:
+            normalized = self._normalized_names.setdefault(
+                namespace, namespace.strip().lower()
+            )
+        return normalized
+
     def configure_namespace(self, namespace: str, ttl: Optional[int]) -> None:
-        normalized = namespace.strip().lower()
+        normalized = self._norm(namespace)
         with self._lock:
             self._namespace_ttls[normalized] = ttl
+            self._resolved_ttls[normalized] = self._resolve_ttl(ttl)
+            self._metrics.setdefault(normalized, _new_counters())
 
-    def _namespaced_key(self, namespace: str, key: str) -> str:
-        normalized = namespace.strip().lower()
-        return f"{normalized}:{key}"
+    @staticmethod
+    def _resolve_ttl(ttl: Optional[int]) -> Optional[int]:
+        if ttl is None or ttl <= 0:
+            return None
+        return ttl
 
-    def _effective_ttl(self, namespace: str, ttl_override: Optional[int]) -> Optional[int]:
+    def _effective_ttl(self, normalized: str, ttl_override: Optional[int]) -> Optional[int]:
         if not self.enabled:
             return None
         if ttl_override is not None:
             return ttl_override if ttl_override > 0 else None
-        normalized = namespace.strip().lower()
-        with self._lock:
-            ttl = self._namespace_ttls.get(normalized, self.default_ttl)
-        if ttl is None or ttl <= 0:
-            return None
-        return ttl
-
-    def _update_metrics(self, namespace: str, *, hit: Optional[bool] = None, stored: bool = False) -> None:
-        normalized = namespace.strip().lower()
-        with self._lock:
-            namespace_metrics = self._metrics.setdefault(
-                normalized, {"hits": 0, "misses": 0, "stores": 0}
-            )
-            if hit is True:
-                namespace_metrics["hits"] += 1
-            elif hit is False:
-                namespace_metrics["misses"] += 1
-            if stored:
-                namespace_metrics["stores"] += 1
+        # Resolved at configure time, so the per-request lookup needs no lock.
+        try:
+            return self._resolved_ttls[normalized]
+        except KeyError:
+            return self._resolve_ttl(self.default_ttl)
+
+    def _update_metrics(self, normalized: str, *, hit: Optional[bool] = None, stored: bool = False) -> None:
+        # Counters are pre-allocated per namespace, so the hot path skips the
+        # lock; a lost increment under contention is acceptable for stats.
+        counters = self._metrics.get(normalized)
+        if counters is None:
+            with self._lock:
+                counters = self._metrics.setdefault(normalized, _new_counters())
+        if hit is True:
+            counters[_HITS] += 1
+        elif hit is False:
+            counters[_MISSES] += 1
+        if stored:
+            counters[_STORES] += 1
 
         if hit is True:
             metrics.increment("cache_hits_total", labels={"namespace": normalized})
@@ -275,16 +592,18 @@ class CacheManager:
         if stored:
             metrics.increment("cache_stores_total", labels={"namespace": normalized})
 
+    def is_namespace_enabled(self, namespace: str, ttl: Optional[int] = None) -> bool:
+        """Return whether a write to ``namespace`` (with optional TTL override) would be stored."""
+
+        return self.enabled and self._effective_ttl(self._norm(namespace), ttl) is not None
+
     def get(self, namespace: str, key: str) -> Tuple[Any, bool]:
         if not self.enabled:
             return None, False
-        namespaced_key = self._namespaced_key(namespace, key)
-        value = self.backend.get(namespaced_key, self._MISSING)
-        hit = value is not self._MISSING
-        self._update_metrics(namespace, hit=hit)
-        if hit:
-            return value, True
-        return None, False
+        normalized = self._norm(namespace)
+        value, hit = self.backend.get_with_hit(normalized, key)
+        self._update_metrics(normalized, hit=hit)
+        return value, hit
 
     def set(
         self,
@@ -295,28 +614,29 @@ class CacheManager:
     ) -> bool:
         if not self.enabled:
             return False
-        effective_ttl = self._effective_ttl(namespace, ttl)
+        normalized = self._norm(namespace)
+        effective_ttl = self._effective_ttl(normalized, ttl)
         if effective_ttl is None:
             logger.debug("Cache disabled for namespace '%s'", namespace)
             return False
-        namespaced_key = self._namespaced_key(namespace, key)
-        self.backend.set(namespaced_key, value, effective_ttl)
-        self._update_metrics(namespace, stored=True)
+        self.backend.set_in(normalized, key, value, effective_ttl)
+        self._update_metrics(normalized, stored=True)
         return True
 
     def delete(self, namespace: str, key: str) -> None:
-        namespaced_key = self._namespaced_key(namespace, key)
-        self.backend.delete(namespaced_key)
+        self.backend.delete_in(self._norm(namespace), key)
 
     def invalidate_namespace(self, namespace: str) -> None:
-        normalized = namespace.strip().lower()
-        prefix = f"{normalized}:"
-        self.backend.clear(prefix)
+        normalized = self._norm(namespace)
+        self.backend.clear_namespace(normalized)
         metrics.increment("cache_invalidations_total", labels={"namespace": normalized})
 
     def get_metrics(self) -> Dict[str, Dict[str, int]]:
         with self._lock:
-            return {namespace: metrics.copy() for namespace, metrics in self._metrics.items()}
+            return {
+                namespace: dict(zip(_COUNTER_FIELDS, counters, strict=True))
+                for namespace, counters in self._metrics.items()
+            }
 
     def describe(self) -> Dict[str, Any]:
         """Return a snapshot of cache configuration and runtime metrics."""
@@ -325,7 +645,11 @@ class CacheManager:
             namespaces = {
                 namespace: {
                     "ttl": ttl,
-                    "metrics": self._metrics.get(namespace, {}).copy(),
+                    "metrics": (
+                        dict(zip(_COUNTER_FIELDS, self._metrics[namespace], strict=True))
+                        if namespace in self._metrics
+                        else {}
+                    ),
                 }
                 for namespace, ttl in self._namespace_ttls.items()
             }
@@ -342,7 +666,6 @@ def _build_cache_manager() -> CacheManager:
     """Factory that creates the global cache manager using configuration."""
 
     default_ttl = config.CACHE_DEFAULT_TTL_SECONDS
-    backend: CacheBackend
     backend_name = (config.CACHE_BACKEND or "").strip().lower()
     ttl_value = default_ttl if default_ttl > 0 else None
 
@@ -350,13 +673,27 @@ def _build_cache_manager() -> CacheManager:
     if not config.CACHE_ENABLED:
         backend = NullCache()
     elif backend_name in {"memory", "inmemory", "local"}:
-        backend = InMemoryCache(default_ttl=ttl_value)
+        backend = InMemoryCache(
+            default_ttl=ttl_value, max_entries=config.CACHE_MAX_ENTRIES_PER_NAMESPACE
+        )
+    elif backend_name == "cachebox":
+        if cachebox is None:
+            logger.warning(
+                "cachebox backend requested but package not installed; falling back to in-memory"
+            )
+            backend = InMemoryCache(
+                default_ttl=ttl_value, max_entries=config.CACHE_MAX_ENTRIES_PER_NAMESPACE
+            )
+        else:
+            backend = CacheboxBackend(default_ttl=ttl_value)
     elif backend_name == "diskcache":
         if diskcache is None:
             logger.warning(
                 "diskcache backend requested but package not installed; falling back to in-memory"
             )
-            backend = InMemoryCache(default_ttl=ttl_value)
+            backend = InMemoryCache(
+                default_ttl=ttl_value, max_entries=config.CACHE_MAX_ENTRIES_PER_NAMESPACE
+            )
         else:
             backend = DiskCacheBackend(
                 config.CACHE_DISKCACHE_DIRECTORY, default_ttl=ttl_value
@@ -397,6 +734,7 @@ __all__ = [
     "CacheEntry",
     "CacheBackend",
     "InMemoryCache",
+    "CacheboxBackend",
     "DiskCacheBackend",
     "RedisCacheBackend",
     "NullCache",
@@ -9,37 +9,60 @@ import logging
 import os
 import re
 import sys
+import threading
 from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency not installed
+    orjson = None  # type: ignore[assignment]
+
+try:  # Prefer central configuration when available
+    from trabajo_ia_server.config import Config as _Config
+except Exception:  # pragma: no cover - defensive fallback
+    _Config = None  # type: ignore[assignment,misc]
+
+_fromtimestamp = datetime.fromtimestamp
+_UTC = timezone.utc
+
 _REQUEST_ID: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
     "trabajo_ia_request_id", default=None
 )
 
-RESERVED_RECORD_ATTRS = {
-    "name",
-    "msg",
-    "args",
-    "levelname",
-    "levelno",
-    "pathname",
-    "filename",
-    "module",
-    "exc_info",
-    "exc_text",
-    "stack_info",
-    "lineno",
-    "funcName",
-    "created",
-    "msecs",
-    "relativeCreated",
-    "thread",
-    "threadName",
-    "processName",
-    "process",
-    "message",
-    "asctime",
-}
+# Number of request ids currently bound across all contexts; lets the log
+# filter skip the context-variable lookup when none are active.
+_ACTIVE_REQUESTS = 0
+_ACTIVE_REQUESTS_LOCK = threading.Lock()
+
+RESERVED_RECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+        "asctime",
+    }
+)
 
 
 def get_request_id() -> Optional[str]:
@@ -51,13 +74,19 @@ def get_request_id() -> Optional[str]:
 def bind_request_id(request_id: Optional[str]) -> contextvars.Token[Optional[str]]:
     """Bind a request identifier to the current context."""
 
+    global _ACTIVE_REQUESTS
+    with _ACTIVE_REQUESTS_LOCK:
+        _ACTIVE_REQUESTS += 1
     return _REQUEST_ID.set(request_id)
 
 
 def reset_request_id(token: contextvars.Token[Optional[str]]) -> None:
     """Reset the request identifier to a previous context token."""
 
+    global _ACTIVE_REQUESTS
     _REQUEST_ID.reset(token)
+    with _ACTIVE_REQUESTS_LOCK:
+        _ACTIVE_REQUESTS = max(0, _ACTIVE_REQUESTS - 1)
 
 
 @contextmanager
@@ -78,6 +107,9 @@ class RequestContextFilter(logging.Filter):
     """Inject the current request id into log records when available."""
 
     def filter(self, record: logging.LogRecord) -> bool:  # pragma: no cover - trivial
+        # Fast path: no request id is bound anywhere (startup, background work).
+        if not _ACTIVE_REQUESTS:
+            return True
         if getattr(record, "request_id", None) is None:
             request_id = get_request_id()
             if request_id is not None:
@@ -129,12 +161,15 @@ class JsonFormatter(logging.Formatter):
     """Serialize log records as JSON for ingestion into observability stacks."""
 
     def __init__(self, *, indent: Optional[int] = None) -> None:
-        super().__init__(datefmt="%Y-%m-%dT%H:%M:%S.%fZ")
+        super().__init__()
         self._indent = indent
 
     def format(self, record: logging.LogRecord) -> str:  # pragma: no cover - formatting
         base: Dict[str, Any] = {
-            "timestamp": self.formatTime(record, self.datefmt),
+            # formatTime() cannot render %f; isoformat gives UTC microseconds directly.
+            "timestamp": _fromtimestamp(record.created, tz=_UTC)
+            .isoformat(timespec="microseconds")
+            .replace("+00:00", "Z"),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -149,20 +184,26 @@ class JsonFormatter(logging.Formatter):
         if record.stack_info:
             base["stack"] = record.stack_info
 
-        # Capture any custom attributes added to the record (excluding internal keys)
-        extras = {
-            key: value
-            for key, value in record.__dict__.items()
-            if key not in RESERVED_RECORD_ATTRS and not key.startswith("_")
-        }
-        if extras:
-            base["extras"] = extras
-
+        # Capture any custom attributes added to the record (excluding internal keys);
+        # the C-level set difference avoids a Python-level membership test per attribute.
+        record_dict = record.__dict__
+        extra_keys = record_dict.keys() - RESERVED_RECORD_ATTRS
+        if extra_keys:
+            extras = {
+                key: record_dict[key] for key in sorted(extra_keys) if key[:1] != "_"
+            }
+            if extras:
+                base["extras"] = extras
+
+        if orjson is not None and self._indent is None:
+            encoded: bytes = orjson.dumps(base, default=str, option=orjson.OPT_NON_STR_KEYS)
+            return encoded.decode("utf-8")
         return json.dumps(base, indent=self._indent, default=str, separators=(",", ":"))
 
 
+@lru_cache(maxsize=8)
 def _resolve_log_configuration(level: Optional[str]) -> tuple[str, str, Optional[int]]:
-    """Derive the effective log level, format, and indent settings."""
+    """Derive the effective log level, format, and indent settings (memoized)."""
 
     resolved_level = level
     log_format = None
@@ -171,17 +212,15 @@ def _resolve_log_configuration(level: Optional[str]) -> tuple[str, str, Optional
     if resolved_level is not None:
         resolved_level = resolved_level.upper()
 
-    try:  # Prefer central configuration when available
-        import trabajo_ia_server.config as config_module  # type: ignore
-
-        config_level = getattr(config_module.Config, "LOG_LEVEL", "INFO")
-        config_format = getattr(config_module.Config, "LOG_FORMAT", "plain")
-        config_indent = getattr(config_module.Config, "LOG_JSON_INDENT", None)
+    if _Config is not None:
+        config_level = getattr(_Config, "LOG_LEVEL", "INFO")
+        config_format = getattr(_Config, "LOG_FORMAT", "plain")
+        config_indent = getattr(_Config, "LOG_JSON_INDENT", None)
 
         resolved_level = resolved_level or str(config_level).upper()
         log_format = str(config_format)
         indent = config_indent if isinstance(config_indent, int) else None
-    except Exception:  # pragma: no cover - defensive fallback
+    else:  # pragma: no cover - defensive fallback
         resolved_level = resolved_level or os.getenv("LOG_LEVEL", "INFO").upper()
         log_format = os.getenv("LOG_FORMAT", "plain")
         indent_value = os.getenv("LOG_JSON_INDENT")
@@ -193,13 +232,39 @@ def _resolve_log_configuration(level: Optional[str]) -> tuple[str, str, Optional
     return resolved_level, log_format.lower(), indent
 
 
+@lru_cache(maxsize=None)
+def _shared_formatter(
+    log_format: str, indent: Optional[int], format_string: Optional[str]
+) -> logging.Formatter:
+    """Return one formatter per configuration, shared by every handler."""
+
+    if log_format == "json":
+        return JsonFormatter(indent=indent)
+    if format_string is None:
+        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    return logging.Formatter(format_string)
+
+
 def setup_logger(
     name: str,
     level: Optional[str] = None,
     format_string: Optional[str] = None,
 ) -> logging.Logger:
-    """Setup and configure a logger instance."""
+    """Setup and configure a logger instance.
+
+    Configuration is memoized per ``(name, level, format_string)``; call
+    ``setup_logger.cache_clear()`` to re-apply changed logging settings.
+    """
 
+    return _configure_logger(name, level, format_string)
+
+
+@lru_cache(maxsize=None)
+def _configure_logger(
+    name: str,
+    level: Optional[str],
+    format_string: Optional[str],
+) -> logging.Logger:
     logger = logging.getLogger(name)
     resolved_level, log_format, indent = _resolve_log_configuration(level)
     numeric_level = getattr(logging, resolved_level.upper(), logging.INFO)
@@ -211,34 +276,46 @@ def setup_logger(
             stream_handler = handler
             break
 
-    if stream_handler is None:
+    # Records still propagate, so host logging config and pytest's caplog see
+    # them. To avoid emitting twice, only attach a handler when no ancestor
+    # (the package logger or an application-configured root) already has one.
+    parent = logger.parent
+    if stream_handler is None and not (parent is not None and parent.hasHandlers()):
         stream_handler = logging.StreamHandler(sys.stdout)
         logger.addHandler(stream_handler)
 
+    # Add secret redacting filter
+    if not any(isinstance(f, SecretRedactingFilter) for f in logger.filters):
+        logger.addFilter(SecretRedactingFilter())
+
+    if stream_handler is None:
+        return logger
+
     stream_handler.setLevel(numeric_level)
 
-    if log_format == "json":
-        formatter = JsonFormatter(indent=indent)
-    else:
-        if format_string is None:
-            format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        formatter = logging.Formatter(format_string)
-    stream_handler.setFormatter(formatter)
-
-    if not any(isinstance(f, RequestContextFilter) for f in logger.filters):
-        logger.addFilter(RequestContextFilter())
+    stream_handler.setFormatter(_shared_formatter(log_format, indent, format_string))
+
+    # The request-id filter lives on the handler only: handler filters also see
+    # records propagated from plain ``logging.getLogger`` children, which
+    # logger-level filters do not, so one attachment covers every record.
     if not any(isinstance(f, RequestContextFilter) for f in stream_handler.filters):
         stream_handler.addFilter(RequestContextFilter())
     
-    # Add secret redacting filter
-    if not any(isinstance(f, SecretRedactingFilter) for f in logger.filters):
-        logger.addFilter(SecretRedactingFilter())
     if not any(isinstance(f, SecretRedactingFilter) for f in stream_handler.filters):
         stream_handler.addFilter(SecretRedactingFilter())
 
     return logger
 
 
+def _clear_logger_caches() -> None:
+    _resolve_log_configuration.cache_clear()
+    _shared_formatter.cache_clear()
+    _configure_logger.cache_clear()
+
+
+setup_logger.cache_clear = _clear_logger_caches  # type: ignore[attr-defined]
+
+
 # Default logger for the application
 default_logger = setup_logger("trabajo_ia_server")
 
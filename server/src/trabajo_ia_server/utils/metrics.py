@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import math
 import threading
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Iterable, Mapping, Optional, Tuple
+from functools import lru_cache
+from typing import DefaultDict, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
 
 from trabajo_ia_server.config import config
 from trabajo_ia_server.utils.logger import setup_logger
@@ -14,88 +17,144 @@ logger = setup_logger(__name__)
 LabelTuple = Tuple[Tuple[str, str], ...]
 
 
-def _normalize_labels(labels: Optional[Mapping[str, object]]) -> LabelTuple:
-    if not labels:
-        return ()
-    normalized = tuple(sorted((str(key), str(value)) for key, value in labels.items()))
-    return normalized
+_EMPTY_LABELS: LabelTuple = ()
+
+
+@lru_cache(maxsize=4096)
+def _interned_labels(items: FrozenSet[Tuple[object, object, type]]) -> LabelTuple:
+    return tuple(sorted((str(key), str(value)) for key, value, _ in items))
 
 
-@dataclass
+def _normalize_labels(labels: Optional[Mapping[str, object]]) -> LabelTuple:
+    if not labels:
+        return _EMPTY_LABELS
+    try:
+        # Callers reuse a handful of label sets; skip the str/sort per call.
+        # The value type is part of the memo key because True == 1 == 1.0.
+        return _interned_labels(
+            frozenset((key, value, type(value)) for key, value in labels.items())
+        )
+    except TypeError:  # unhashable label value
+        return tuple(sorted((str(key), str(value)) for key, value in labels.items()))
+
+
+@dataclass(slots=True)
 class HistogramState:
     count: int = 0
     total: float = 0.0
-    minimum: Optional[float] = None
-    maximum: Optional[float] = None
+    # Infinite sentinels let observe() skip the "first sample" branch.
+    minimum: float = math.inf
+    maximum: float = -math.inf
 
     def observe(self, value: float) -> None:
         self.count += 1
         self.total += value
-        self.minimum = value if self.minimum is None else min(self.minimum, value)
-        self.maximum = value if self.maximum is None else max(self.maximum, value)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
 
     def as_dict(self) -> Dict[str, float]:
-        average = self.total / self.count if self.count else 0.0
+        if not self.count:
+            return {"count": 0.0, "sum": 0.0, "avg": 0.0, "min": 0.0, "max": 0.0}
         return {
             "count": float(self.count),
             "sum": float(self.total),
-            "avg": float(average),
-            "min": float(self.minimum if self.minimum is not None else 0.0),
-            "max": float(self.maximum if self.maximum is not None else 0.0),
+            "avg": float(self.total / self.count),
+            "min": float(self.minimum),
+            "max": float(self.maximum),
         }
 
 
+def _noop(*args: object, **kwargs: object) -> None:
+    return None
+
+
 class MetricsRegistry:
     """Thread-safe registry that tracks counters, gauges, and histograms."""
 
+    _RECORDING_METHODS = ("increment", "set_gauge", "observe")
+
     def __init__(self, *, enabled: bool = True) -> None:
-        self.enabled = enabled
         self._lock = threading.RLock()
         self._counters: Dict[str, Dict[LabelTuple, float]] = {}
         self._gauges: Dict[str, Dict[LabelTuple, float]] = {}
-        self._histograms: Dict[str, Dict[LabelTuple, HistogramState]] = {}
+        self._histograms: DefaultDict[str, DefaultDict[LabelTuple, HistogramState]] = defaultdict(
+            lambda: defaultdict(HistogramState)
+        )
+        self.enabled = enabled
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        # While disabled, the recording methods are shadowed by an instance-level
+        # no-op so calls skip label normalization entirely. Callers building
+        # expensive label mappings should still guard with ``if metrics.enabled``.
+        self._enabled = bool(value)
+        for method in self._RECORDING_METHODS:
+            if self._enabled:
+                self.__dict__.pop(method, None)
+            else:
+                setattr(self, method, _noop)
 
     def increment(self, name: str, amount: float = 1.0, *, labels: Optional[Mapping[str, object]] = None) -> None:
-        if not self.enabled:
-            return
         label_key = _normalize_labels(labels)
+        value = amount if type(amount) is float else float(amount)
+        # The read-modify-write must stay under the lock; ``+=`` on a shared
+        # cell is not atomic across threads.
         with self._lock:
             bucket = self._counters.setdefault(name, {})
-            bucket[label_key] = bucket.get(label_key, 0.0) + float(amount)
+            bucket[label_key] = bucket.get(label_key, 0.0) + value
 
     def set_gauge(self, name: str, value: float, *, labels: Optional[Mapping[str, object]] = None) -> None:
-        if not self.enabled:
-            return
         label_key = _normalize_labels(labels)
-        with self._lock:
-            bucket = self._gauges.setdefault(name, {})
+        bucket = self._gauges.get(name)
+        if bucket is not None and label_key in bucket:
+            # Overwriting an existing key is a single atomic dict store.
             bucket[label_key] = float(value)
+            return
+        # New keys resize the dict, so register them under the export lock.
+        with self._lock:
+            self._gauges.setdefault(name, {})[label_key] = float(value)
 
     def observe(self, name: str, value: float, *, labels: Optional[Mapping[str, object]] = None) -> None:
-        if not self.enabled:
-            return
         label_key = _normalize_labels(labels)
         with self._lock:
-            bucket = self._histograms.setdefault(name, {})
-            state = bucket.setdefault(label_key, HistogramState())
-            state.observe(float(value))
+            self._histograms[name][label_key].observe(float(value))
 
     def export(self) -> Dict[str, Dict[str, float]]:
         """Export the current metrics snapshot as dictionaries."""
 
+        # Copy raw (labels, value) pairs under the lock and stringify the label
+        # keys afterwards, so writers are only blocked for the shallow copy.
         with self._lock:
-            counters = {
-                name: {str(labels): value for labels, value in bucket.items()}
+            counter_items = [
+                (name, list(bucket.items()))
                 for name, bucket in self._counters.items()
-            }
-            gauges = {
-                name: {str(labels): value for labels, value in bucket.items()}
-                for name, bucket in self._gauges.items()
-            }
-            histograms = {
-                name: {str(labels): state.as_dict() for labels, state in bucket.items()}
+            ]
+            gauge_items = [
+                (name, list(bucket.items())) for name, bucket in self._gauges.items()
+            ]
+            histogram_items = [
+                (name, [(labels, state.as_dict()) for labels, state in bucket.items()])
                 for name, bucket in self._histograms.items()
-            }
+            ]
+
+        counters = {
+            name: {str(labels): value for labels, value in items}
+            for name, items in counter_items
+        }
+        gauges = {
+            name: {str(labels): value for labels, value in items}
+            for name, items in gauge_items
+        }
+        histograms = {
+            name: {str(labels): value for labels, value in items}
+            for name, items in histogram_items
+        }
 
         return {"counters": counters, "gauges": gauges, "histograms": histograms}
 
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import array
 import threading
 import time
-from collections import deque
-from typing import Callable, Deque, Dict, Optional
+from typing import Callable, Dict, Optional
 
 from trabajo_ia_server.config import config
 from trabajo_ia_server.utils.logger import setup_logger
@@ -13,30 +13,52 @@ from trabajo_ia_server.utils.metrics import metrics
 
 logger = setup_logger(__name__)
 
+_NS_PER_SECOND = 1_000_000_000
+
 
 class _RateWindow:
-    """Sliding window tracker enforcing an upper bound on events."""
+    """Sliding window tracker enforcing an upper bound on events.
+
+    Timestamps are integer nanoseconds and live in a fixed ``capacity``-slot
+    ring buffer: the window never needs more than ``capacity`` entries, since a
+    full window blocks recording.
+    """
 
     def __init__(self, capacity: int, window_seconds: float) -> None:
         self.capacity = capacity
-        self.window = window_seconds
-        self._timestamps: Deque[float] = deque()
-
-    def _prune(self, now: float) -> None:
+        self.window = int(window_seconds * _NS_PER_SECOND)
+        self._ts = array.array("q", [0]) * capacity
+        self._head = 0
+        self._size = 0
+        self._pruned_at: Optional[int] = None
+
+    def _prune(self, now: int) -> None:
+        # acquire() checks then records at the same instant; the second prune
+        # would find nothing to drop, so skip it.
+        if now == self._pruned_at:
+            return
+        self._pruned_at = now
         threshold = now - self.window
-        while self._timestamps and self._timestamps[0] <= threshold:
-            self._timestamps.popleft()
+        ts, head, size, capacity = self._ts, self._head, self._size, self.capacity
+        while size and ts[head] <= threshold:
+            head = (head + 1) % capacity
+            size -= 1
+        self._head, self._size = head, size
 
-    def required_wait(self, now: float) -> float:
+    def required_wait(self, now: int) -> int:
         self._prune(now)
-        if len(self._timestamps) < self.capacity:
-            return 0.0
-        earliest = self._timestamps[0]
-        return max(0.0, earliest + self.window - now)
+        if self._size < self.capacity:
+            return 0
+        return max(0, self._ts[self._head] + self.window - now)
 
-    def record(self, timestamp: float) -> None:
+    def record(self, timestamp: int) -> None:
         self._prune(timestamp)
-        self._timestamps.append(timestamp)
+        if self._size == self.capacity:
+            # Callers check required_wait first; if not, drop the oldest entry.
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+        self._ts[(self._head + self._size) % self.capacity] = timestamp
+        self._size += 1
 
 
 class CoordinatedRateLimiter:
@@ -51,10 +73,14 @@ class CoordinatedRateLimiter:
         time_func: Callable[[], float] | None = None,
         sleep_func: Callable[[float], None] | None = None,
     ) -> None:
-        self._now = time_func or time.monotonic
+        if time_func is None:
+            self._now_ns: Callable[[], int] = time.monotonic_ns
+        else:
+            # Injected clocks keep the float-seconds contract.
+            self._now_ns = lambda: int(time_func() * _NS_PER_SECOND)
         self._sleep = sleep_func or time.sleep
         self._lock = threading.RLock()
-        self._penalty_until = 0.0
+        self._penalty_until = 0
         self._per_second = per_second
         self._per_minute = per_minute
 
@@ -76,8 +102,8 @@ class CoordinatedRateLimiter:
         else:
             logger.info("Rate limiter disabled")
 
-    def _required_wait_locked(self, now: float) -> float:
-        wait = max(0.0, self._penalty_until - now)
+    def _required_wait_locked(self, now: int) -> int:
+        wait = max(0, self._penalty_until - now)
         for window in self._windows:
             wait = max(wait, window.required_wait(now))
         return wait
@@ -90,13 +116,14 @@ class CoordinatedRateLimiter:
 
         while True:
             with self._lock:
-                now = self._now()
-                wait = self._required_wait_locked(now)
-                if wait <= 0:
+                now = self._now_ns()
+                wait_ns = self._required_wait_locked(now)
+                if wait_ns <= 0:
                     for window in self._windows:
                         window.record(now)
                     metrics.increment("rate_limiter_acquire_total")
                     return
+            wait = wait_ns / _NS_PER_SECOND
             self._sleep(wait)
             metrics.observe("rate_limiter_wait_seconds", wait)
 
@@ -107,8 +134,7 @@ class CoordinatedRateLimiter:
             return
 
         with self._lock:
-            now = self._now()
-            penalty_until = now + delay
+            penalty_until = self._now_ns() + int(delay * _NS_PER_SECOND)
             if penalty_until > self._penalty_until:
                 logger.warning("Applying shared backoff of %.2fs", delay)
             self._penalty_until = max(self._penalty_until, penalty_until)
@@ -118,7 +144,7 @@ class CoordinatedRateLimiter:
         """Return a serializable representation of the limiter state."""
 
         with self._lock:
-            penalty_remaining = max(0.0, self._penalty_until - self._now())
+            penalty_remaining = max(0, self._penalty_until - self._now_ns()) / _NS_PER_SECOND
 
         return {
             "enabled": self.enabled,
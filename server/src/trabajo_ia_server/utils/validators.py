@@ -3,9 +3,17 @@ Validation utilities for Trabajo IA Server.
 
 Provides validators for common data formats and inputs.
 """
-from datetime import datetime
+import calendar
+import re
 from typing import Optional
 
+# Mirrors the leniency of strptime("%Y-%m-%d"): unpadded month/day and a
+# space-padded day (" 5") are accepted. Parsed by hand because strptime is
+# several times slower on this hot validation path.
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2}| [1-9])")
+
+_STRIP_UNDERSCORES = str.maketrans("", "", "_")
+
 
 def validate_date_format(date_str: Optional[str]) -> bool:
     """
@@ -20,11 +28,13 @@ def validate_date_format(date_str: Optional[str]) -> bool:
     if date_str is None:
         return True
 
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return True
-    except ValueError:
+    match = _DATE_RE.fullmatch(date_str)
+    if match is None:
+        return False
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if year < 1 or not 1 <= month <= 12:
         return False
+    return 1 <= day <= calendar.monthrange(year, month)[1]
 
 
 def validate_series_id(series_id: str) -> bool:
@@ -40,5 +50,5 @@ def validate_series_id(series_id: str) -> bool:
     if not series_id:
         return False
 
-    # FRED series IDs are typically uppercase alphanumeric
-    return series_id.replace("_", "").isalnum()
+    # FRED series IDs are typically uppercase alphanumeric (underscores allowed)
+    return series_id.translate(_STRIP_UNDERSCORES).isalnum()
@@ -7,8 +7,15 @@ Complete GDP analysis tool with 3-layer architecture:
 - format_layer: Output formatting (JSON, tidy dataset, summary)
 """
 import json
-from typing import Dict, List, Optional, Union
-from datetime import datetime
+import logging
+import time
+from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timezone
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency not installed
+    orjson = None  # type: ignore[assignment]
 
 from trabajo_ia_server.config import config, ConfigError
 from trabajo_ia_server.utils.logger import setup_logger
@@ -25,6 +32,32 @@ from trabajo_ia_server.workflows.layers.format_output import (
 
 logger = setup_logger(__name__)
 
+_TOOL_NAME = "analyze_gdp_cross_country"
+
+
+def _compact_dumps(payload: Any) -> str:
+    """Shared compact encoder for every response envelope (orjson when installed)."""
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(
+            payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+        return encoded.decode("utf-8")
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def _error_response(
+    error: str,
+    fetch_timestamp: str,
+    *,
+    metadata: Optional[Dict[str, Any]] = None,
+    **fields: Any,
+) -> str:
+    """Build the compact error envelope (tool, error, extra fields, metadata)."""
+    payload: Dict[str, Any] = {"tool": _TOOL_NAME, "error": error}
+    payload.update(fields)
+    payload["metadata"] = {"fetch_timestamp": fetch_timestamp, **(metadata or {})}
+    return _compact_dumps(payload)
+
 
 def analyze_gdp_cross_country(
     # === PAÍSES ===
@@ -102,26 +135,24 @@ def analyze_gdp_cross_country(
         ...     detect_structural_breaks=True
         ... )
     """
-    start_time = datetime.utcnow()
+    start_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    t0 = time.monotonic()
     
     try:
         # === PHASE 0: VALIDATE FRED API KEY ===
         try:
             config.get_fred_api_key()
         except ConfigError as e:
-            logger.error(f"Configuration error: {e}")
-            return json.dumps({
-                "tool": "analyze_gdp_cross_country",
-                "error": "FRED_API_KEY_MISSING",
-                "error_message": str(e),
-                "metadata": {
-                    "fetch_timestamp": start_time.isoformat() + "Z"
-                }
-            }, separators=(",", ":"))
+            logger.error("Configuration error: %s", e)
+            return _error_response(
+                "FRED_API_KEY_MISSING", start_iso, error_message=str(e)
+            )
         
         logger.info(
-            f"GDP Analysis Request: countries={countries}, "
-            f"variants={gdp_variants}, format={output_format}"
+            "GDP Analysis Request: countries=%s, variants=%s, format=%s",
+            countries,
+            gdp_variants,
+            output_format,
         )
         
         # === PHASE 1: INPUT VALIDATION ===
@@ -137,28 +168,29 @@ def analyze_gdp_cross_country(
         )
         
         if not validation_result["valid"]:
-            logger.error(f"Validation failed: {validation_result['errors']}")
-            return json.dumps({
-                "tool": "analyze_gdp_cross_country",
-                "error": "Input validation failed",
-                "validation_errors": validation_result["errors"],
-                "warnings": validation_result["warnings"],
-                "metadata": {
-                    "fetch_timestamp": start_time.isoformat() + "Z"
-                }
-            }, separators=(",", ":"))
+            logger.error("Validation failed: %s", validation_result["errors"])
+            return _error_response(
+                "Input validation failed",
+                start_iso,
+                validation_errors=validation_result["errors"],
+                warnings=validation_result["warnings"],
+            )
         
         validated_countries = validation_result["countries"]
         validated_variants = validation_result["variants"]
         
         logger.info(
-            f"Validation passed: {len(validated_countries)} countries, "
-            f"{len(validated_variants)} variants"
+            "Validation passed: %d countries, %d variants",
+            len(validated_countries),
+            len(validated_variants),
         )
         
-        # Log warnings
-        for warning in validation_result["warnings"]:
-            logger.warning(f"Validation warning: {warning}")
+        # Log warnings (one record for the batch)
+        warnings_list = validation_result["warnings"]
+        if warnings_list and logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Validation warnings (%d): %s", len(warnings_list), " | ".join(warnings_list)
+            )
         
         # === PHASE 2: FETCH DATA (Layer 1) ===
         logger.info("Starting fetch_data_layer...")
@@ -167,53 +199,55 @@ def analyze_gdp_cross_country(
             countries=validated_countries,
             variants=validated_variants,
             start_date=start_date or "1960-01-01",
-            end_date=end_date,
-            cache_ttl=86400  # Default 24h
+            end_date=end_date
         )
         
         logger.info(
-            f"Fetch complete: {len(fetch_result.metadata['fetched_series'])} series, "
-            f"{len(fetch_result.metadata['missing_series'])} missing"
+            "Fetch complete: %d series, %d missing",
+            len(fetch_result.metadata["fetched_series"]),
+            len(fetch_result.metadata["missing_series"]),
         )
         
         # === CHECK: Early-exit if no data fetched ===
         if not fetch_result.data or all(not country_data for country_data in fetch_result.data.values()):
             logger.error("No data fetched for any country/variant")
-            return json.dumps({
-                "tool": "analyze_gdp_cross_country",
-                "error": "NO_DATA_FETCHED",
-                "error_message": "Could not fetch any data from FRED for the requested countries/variants",
-                "details": {
+            return _error_response(
+                "NO_DATA_FETCHED",
+                start_iso,
+                metadata={"fetched_series_count": len(fetch_result.metadata["fetched_series"])},
+                error_message="Could not fetch any data from FRED for the requested countries/variants",
+                details={
                     "requested_countries": validated_countries,
                     "requested_variants": validated_variants,
                     "missing_series": fetch_result.metadata["missing_series"],
                     "errors": fetch_result.metadata["errors"]
                 },
-                "metadata": {
-                    "fetch_timestamp": start_time.isoformat() + "Z",
-                    "fetched_series_count": len(fetch_result.metadata["fetched_series"])
-                }
-            }, separators=(",", ":"))
+            )
         
         # === PHASE 3: ANALYSIS (Layer 2) ===
-        logger.info("Starting analysis_layer...")
-        
-        analysis_result = analyze_gdp_data(
-            data=fetch_result.data,
-            variants=validated_variants,
-            start_date=start_date,
-            end_date=end_date,
-            compute_convergence=include_convergence,
-            detect_structural_breaks=detect_structural_breaks,
-            include_rankings=include_rankings,
-            include_growth_metrics=include_growth_analysis,
-            comparison_mode=comparison_mode
-        )
-        
-        logger.info("Analysis complete")
+        # The tidy dataset is built from the raw series alone, so skip the
+        # analysis layer (stats, convergence, breaks, rankings) for it.
+        analysis_result = None
+        if output_format != "dataset":
+            logger.info("Starting analysis_layer...")
+            
+            analysis_result = analyze_gdp_data(
+                data=fetch_result.data,
+                by_variant=fetch_result.by_variant,
+                variants=validated_variants,
+                start_date=start_date,
+                end_date=end_date,
+                compute_convergence=include_convergence,
+                detect_structural_breaks=detect_structural_breaks,
+                include_rankings=include_rankings,
+                include_growth_metrics=include_growth_analysis,
+                comparison_mode=comparison_mode
+            )
+            
+            logger.info("Analysis complete")
         
         # === PHASE 4: FORMAT OUTPUT (Layer 3) ===
-        logger.info(f"Formatting output: format={output_format}")
+        logger.info("Formatting output: format=%s", output_format)
         
         # Route to appropriate formatter
         format_metadata = {
@@ -247,42 +281,33 @@ def analyze_gdp_cross_country(
             )
         else:
             # Fallback to analysis format
-            logger.warning(f"Unknown format '{output_format}', using 'analysis'")
+            logger.warning("Unknown format '%s', using 'analysis'", output_format)
             format_result = format_analysis(analysis_result, format_metadata)
         
-        end_time = datetime.utcnow()
-        elapsed = (end_time - start_time).total_seconds()
+        elapsed = time.monotonic() - t0
         
         logger.info(
-            f"GDP analysis completed in {elapsed:.2f}s "
-            f"(format: {format_result.format_type})"
+            "GDP analysis completed in %.2fs (format: %s)",
+            elapsed,
+            format_result.format_type,
         )
         
         # Return formatted output (already JSON string for MCP)
         return format_result.output
         
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
-        return json.dumps({
-            "tool": "analyze_gdp_cross_country",
-            "error": f"Invalid input: {str(e)}",
-            "input_parameters": {
+        logger.error("Validation error: %s", e)
+        return _error_response(
+            f"Invalid input: {str(e)}",
+            start_iso,
+            input_parameters={
                 "countries": countries,
                 "gdp_variants": gdp_variants,
                 "start_date": start_date,
                 "end_date": end_date
             },
-            "metadata": {
-                "fetch_timestamp": datetime.utcnow().isoformat() + "Z"
-            }
-        }, separators=(",", ":"))
+        )
         
     except Exception as e:
-        logger.error(f"Unexpected error in GDP analysis: {e}", exc_info=True)
-        return json.dumps({
-            "tool": "analyze_gdp_cross_country",
-            "error": f"Internal error: {str(e)}",
-            "metadata": {
-                "fetch_timestamp": datetime.utcnow().isoformat() + "Z"
-            }
-        }, separators=(",", ":"))
+        logger.error("Unexpected error in GDP analysis: %s", e, exc_info=True)
+        return _error_response(f"Internal error: {str(e)}", start_iso)
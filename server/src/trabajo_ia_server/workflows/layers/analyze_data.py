@@ -9,7 +9,7 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
-from scipy import stats
+from scipy.special import stdtr
 
 from trabajo_ia_server.utils.logger import setup_logger
 
@@ -28,7 +28,8 @@ class AnalysisResult:
 def _apply_indexed_transformation(
     data: Dict[str, Dict[str, pd.Series]],
     variants: List[str],
-    base_year: int
+    base_year: int,
+    by_variant: Optional[Dict[str, pd.DataFrame]] = None
 ) -> Dict[str, Dict[str, pd.Series]]:
     """
     Transform data to indexed values (base_year = 100).
@@ -37,44 +38,55 @@ def _apply_indexed_transformation(
         data: Dict[country][variant] = pd.Series
         variants: Variants to transform
         base_year: Year to use as base (value = 100)
+        by_variant: Optional per-variant DataFrames of the same data (reused if given)
     
     Returns:
         Transformed data with indexed values
     """
-    indexed_data = {}
+    indexed_data: Dict[str, Dict[str, pd.Series]] = {country: {} for country in data}
     
-    for country, country_data in data.items():
-        indexed_data[country] = {}
+    for variant in variants:
+        series_by_country = {
+            country: country_data[variant]
+            for country, country_data in data.items()
+            if variant in country_data
+        }
+        if not series_by_country:
+            continue
         
-        for variant in variants:
-            if variant not in country_data:
+        # Resolve every country's base value at once: align the variant's series
+        # as columns and take the first observation within base_year per column
+        # (Jan 1 when present, otherwise the closest later date in that year).
+        frame = by_variant.get(variant) if by_variant else None
+        if frame is None:
+            frame = pd.concat(series_by_country, axis=1)
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index()
+        # Binary-search the base year's bounds instead of masking every date
+        start, stop = frame.index.searchsorted(
+            [pd.Timestamp(year=base_year, month=1, day=1), pd.Timestamp(year=base_year + 1, month=1, day=1)]
+        )
+        year_rows = frame.iloc[start:stop]
+        found = year_rows.notna().any()
+        if len(year_rows):
+            base_values = year_rows.bfill().iloc[0]
+        else:
+            base_values = pd.Series(np.nan, index=frame.columns)
+        
+        for country, series in series_by_country.items():
+            if not found[country]:
+                logger.warning(f"Base year {base_year} not found for {country}/{variant}, skipping indexed transformation")
+                indexed_data[country][variant] = series
                 continue
             
-            series = country_data[variant]
-            
-            # Find base year value
-            base_year_date = pd.Timestamp(f"{base_year}-01-01")
-            
-            if base_year_date not in series.index:
-                # Try to find closest year
-                year_values = series[series.index.year == base_year]
-                if len(year_values) > 0:
-                    base_value = year_values.iloc[0]
-                else:
-                    logger.warning(f"Base year {base_year} not found for {country}/{variant}, skipping indexed transformation")
-                    indexed_data[country][variant] = series
-                    continue
-            else:
-                base_value = series[base_year_date]
-            
+            base_value = base_values[country]
             if base_value == 0 or pd.isna(base_value):
                 logger.warning(f"Base year value is 0 or NaN for {country}/{variant}, skipping indexed transformation")
                 indexed_data[country][variant] = series
                 continue
             
             # Transform to index (base = 100)
-            indexed_series = (series / base_value) * 100
-            indexed_data[country][variant] = indexed_series
+            indexed_data[country][variant] = (series / base_value) * 100
             logger.debug(f"Indexed {country}/{variant} to base_year={base_year} (base_value={base_value:.2f})")
     
     return indexed_data
@@ -90,7 +102,8 @@ def analyze_gdp_data(
     include_rankings: bool = False,
     include_growth_metrics: bool = False,
     comparison_mode: str = "absolute",
-    base_year: Optional[int] = None
+    base_year: Optional[int] = None,
+    by_variant: Optional[Dict[str, pd.DataFrame]] = None
 ) -> AnalysisResult:
     """
     Analyze GDP data across countries.
@@ -106,6 +119,8 @@ def analyze_gdp_data(
         include_growth_metrics: Whether to compute growth metrics
         comparison_mode: Analysis mode ("absolute", "indexed", "growth_rates", "ppp")
         base_year: Base year for indexed mode (required if comparison_mode="indexed")
+        by_variant: Optional Dict[variant] = DataFrame (dates x countries) of the same
+            data, as built by the fetch layer; used for whole-matrix operations
     
     Returns:
         AnalysisResult with by_country and cross_country analysis
@@ -116,17 +131,17 @@ def analyze_gdp_data(
     period_years = None
     if start_date and end_date:
         try:
-            from datetime import datetime
-            start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00')) if isinstance(start_date, str) else start_date
-            end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00')) if isinstance(end_date, str) else end_date
-            period_years = round((end_dt - start_dt).days / 365.25, 1)
-        except:
+            # pd.Timestamp parses ISO strings (including a Z suffix) and datetimes alike
+            period_years = round((pd.Timestamp(end_date) - pd.Timestamp(start_date)).days / 365.25, 1)
+        except (ValueError, TypeError):
             period_years = None
     
     # Apply comparison mode transformation
     if comparison_mode == "indexed" and base_year is not None:
         logger.info(f"Applying indexed transformation with base_year={base_year}")
-        data = _apply_indexed_transformation(data, variants, base_year)
+        data = _apply_indexed_transformation(data, variants, base_year, by_variant)
+        # The per-variant frames hold the untransformed values from here on
+        by_variant = None
     
     by_country: Dict[str, Dict[str, Any]] = {}
     cross_country: Dict[str, Any] = {}
@@ -143,6 +158,22 @@ def analyze_gdp_data(
         }
     }
     
+    # CAGR per (country, variant), filled by the per-country pass
+    cagr_by_series: Dict[Tuple[str, str], Optional[float]] = {}
+    
+    # Growth metrics for every country at once, one stacked matrix per variant
+    growth_by_series: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    if include_growth_metrics:
+        for variant in variants:
+            series_by_country = {
+                country: country_data[variant]
+                for country, country_data in data.items()
+                if country_data.get(variant) is not None and len(country_data[variant]) > 1
+            }
+            if series_by_country:
+                for country, metrics in _batch_growth_metrics(series_by_country, variant).items():
+                    growth_by_series[(country, variant)] = metrics
+    
     # Analyze each country
     for country, country_data in data.items():
         by_country[country] = {}
@@ -159,21 +190,24 @@ def analyze_gdp_data(
                 logger.warning(f"Empty or None series for {country} - {variant}")
                 continue
             
-            # Basic stats
+            # Basic stats: one float64 buffer and one date conversion per series
+            values = series.to_numpy(dtype=np.float64)
+            first_date, last_date = np.datetime_as_string(series.index.values[[0, -1]], unit="D")
             by_country[country][variant] = {
                 "observations": len(series),
-                "first_date": series.index[0].strftime("%Y-%m-%d"),
-                "last_date": series.index[-1].strftime("%Y-%m-%d"),
-                "latest_value": float(series.iloc[-1]),
-                "mean": float(series.mean()),
-                "std": float(series.std()),
-                "min": float(series.min()),
-                "max": float(series.max())
+                "first_date": str(first_date),
+                "last_date": str(last_date),
+                "latest_value": float(values[-1]),
+                **_basic_stats(values)
             }
             
             # Growth metrics
             if include_growth_metrics and len(series) > 1:
-                by_country[country][variant]["growth_metrics"] = _compute_growth_metrics(series, variant)
+                growth_metrics = growth_by_series[(country, variant)]
+                by_country[country][variant]["growth_metrics"] = growth_metrics
+                if variant != "growth_rate":
+                    # Reused by the growth rankings below instead of recomputing
+                    cagr_by_series[(country, variant)] = growth_metrics["cagr"]
             
             # Structural breaks
             if detect_structural_breaks and len(series) > 20:
@@ -183,15 +217,23 @@ def analyze_gdp_data(
     if len(data) > 1:
         for variant in variants:
             # Collect latest values for all countries
-            latest_values = {}
-            all_series = {}
-            
-            for country, country_data in data.items():
-                if variant in country_data:
-                    series = country_data[variant]
-                    if len(series) > 0:
-                        latest_values[country] = float(series.iloc[-1])
-                        all_series[country] = series
+            frame = by_variant.get(variant) if by_variant else None
+            if frame is not None:
+                # Each column's last observation in one call (fetched series hold no NaN)
+                latest = frame.ffill().iloc[-1].dropna()
+                latest_array = latest.to_numpy(dtype=np.float64)
+                latest_values = dict(zip(latest.index, latest_array.tolist(), strict=True))
+                all_series = {country: data[country][variant] for country in latest.index}
+            else:
+                latest_values = {}
+                all_series = {}
+                for country, country_data in data.items():
+                    if variant in country_data:
+                        series = country_data[variant]
+                        if len(series) > 0:
+                            latest_values[country] = float(series.iloc[-1])
+                            all_series[country] = series
+                latest_array = np.fromiter(latest_values.values(), dtype=np.float64, count=len(latest_values))
             
             if len(latest_values) < 2:
                 continue
@@ -201,27 +243,19 @@ def analyze_gdp_data(
                 cross_country[variant] = {}
             
             # Basic cross-country stats
-            values_list = list(latest_values.values())
-            cross_country[variant]["latest_snapshot"] = {
-                "mean": float(np.mean(values_list)),
-                "median": float(np.median(values_list)),
-                "std": float(np.std(values_list)),
-                "min": float(np.min(values_list)),
-                "max": float(np.max(values_list)),
-                "coefficient_of_variation": float(np.std(values_list) / np.mean(values_list)) if np.mean(values_list) != 0 else None
-            }
+            cross_country[variant]["latest_snapshot"] = _snapshot_stats(latest_array)
             
             # Rankings
             if include_rankings:
-                sorted_countries = sorted(latest_values.items(), key=lambda x: x[1], reverse=True)
-                rankings[f"{variant}_level"] = sorted_countries
+                rankings[f"{variant}_level"] = _rank_descending(latest_values)
                 
                 # Growth rankings if we have growth_rate
                 if variant == "growth_rate" or include_growth_metrics:
                     growth_ranks = {}
                     for country, series in all_series.items():
                         if len(series) > 1:
-                            cagr = _compute_cagr(series)
+                            key = (country, variant)
+                            cagr = cagr_by_series[key] if key in cagr_by_series else _compute_cagr(series)
                             if cagr is not None:
                                 growth_ranks[country] = cagr
                     
@@ -229,12 +263,14 @@ def analyze_gdp_data(
                         # Filter out None values before sorting
                         valid_growth = {k: v for k, v in growth_ranks.items() if v is not None}
                         if valid_growth:
-                            sorted_growth = sorted(valid_growth.items(), key=lambda x: x[1], reverse=True)
-                            rankings[f"{variant}_growth"] = sorted_growth
+                            rankings[f"{variant}_growth"] = _rank_descending(valid_growth)
             
             # Convergence analysis
             if compute_convergence and len(all_series) > 2:
-                cross_country[variant]["convergence"] = _compute_convergence(all_series)
+                aligned = None
+                if by_variant and variant in by_variant:
+                    aligned = by_variant[variant][list(all_series)].dropna()
+                cross_country[variant]["convergence"] = _compute_convergence(all_series, aligned)
     
     logger.info(f"Analysis complete: {len(by_country)} countries analyzed")
     
@@ -246,31 +282,107 @@ def analyze_gdp_data(
     )
 
 
-def _compute_growth_metrics(series: pd.Series, variant: str = None) -> Dict[str, Any]:
-    """Compute growth metrics for a time series."""
-    if len(series) < 2:
-        return {}
-    
-    # Skip CAGR for growth_rate variant (CAGR of growth rates doesn't make sense)
-    cagr = None if variant == "growth_rate" else _compute_cagr(series)
-    
-    # Year-over-year growth
-    yoy_growth = series.pct_change() * 100
-    
-    # Volatility
-    volatility = float(yoy_growth.std()) if len(yoy_growth) > 1 else None
-    
-    # Stability index (1 / (1 + volatility))
-    stability_index = 1 / (1 + volatility) if volatility is not None else None
-    
+def _basic_stats(values: np.ndarray) -> Dict[str, float]:
+    """Mean/std/min/max from one NaN-free array instead of four pandas reductions."""
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return {"mean": np.nan, "std": np.nan, "min": np.nan, "max": np.nan}
+    return {
+        "mean": float(values.mean()),
+        "std": float(values.std(ddof=1)) if values.size > 1 else np.nan,
+        "min": float(values.min()),
+        "max": float(values.max())
+    }
+
+
+def _snapshot_stats(values: np.ndarray) -> Dict[str, Optional[float]]:
+    """Cross-country snapshot stats, reducing the array once per statistic."""
+    mean = float(values.mean())
+    std = float(values.std())
     return {
-        "cagr": cagr,
-        "volatility": volatility,
-        "stability_index": stability_index,
-        "total_growth_pct": float(((series.iloc[-1] / series.iloc[0]) - 1) * 100) if series.iloc[0] != 0 else None
+        "mean": mean,
+        "median": float(np.median(values)),
+        "std": std,
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "coefficient_of_variation": std / mean if mean != 0 else None
     }
 
 
+def _rank_descending(values: Dict[str, float]) -> List[Tuple[str, float]]:
+    """Rank countries by value, highest first; ties keep insertion order."""
+    countries = list(values)
+    scores = np.fromiter(values.values(), dtype=np.float64, count=len(countries))
+    order = np.argsort(-scores, kind="stable")
+    return [(countries[i], float(scores[i])) for i in order]
+
+
+def _stack_series(series_list: List[pd.Series]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack series as rows of a NaN-padded float matrix.
+    
+    Rows are aligned by position rather than date, so per-row differences match
+    each series' own ``pct_change``. Returns the matrix and the row lengths.
+    """
+    lengths = np.fromiter((len(s) for s in series_list), dtype=np.intp, count=len(series_list))
+    mat = np.full((len(series_list), int(lengths.max())), np.nan)
+    for row, series in enumerate(series_list):
+        mat[row, :lengths[row]] = series.to_numpy(dtype=np.float64)
+    return mat, lengths
+
+
+def _batch_growth_metrics(
+    series_by_country: Dict[str, pd.Series],
+    variant: str = None
+) -> Dict[str, Dict[str, Any]]:
+    """Growth metrics for several series (each with 2+ points) in one vectorized pass."""
+    countries = list(series_by_country)
+    mat, lengths = _stack_series(list(series_by_country.values()))
+    rows = np.arange(len(countries))
+    in_range = np.arange(mat.shape[1]) < lengths[:, None]
+    
+    # Forward-fill gaps as pct_change does, then difference consecutive columns
+    positions = np.where(np.isnan(mat), 0, np.arange(mat.shape[1]))
+    filled = mat[rows[:, None], np.maximum.accumulate(positions, axis=1)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = (filled[:, 1:] / filled[:, :-1] - 1) * 100
+        pct[~in_range[:, 1:]] = np.nan
+        first = mat[:, 0]
+        last = mat[rows, lengths - 1]
+        total_growth = (last / first - 1) * 100
+    
+    # Volatility: sample std of the non-NaN period changes per row (nanstd, ddof=1,
+    # without the degrees-of-freedom warnings for rows with a single change)
+    valid = ~np.isnan(pct)
+    counts = valid.sum(axis=1)
+    sums = np.where(valid, pct, 0.0).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = sums / counts
+        squares = np.where(valid, (pct - means[:, None]) ** 2, 0.0).sum(axis=1)
+        volatility = np.sqrt(squares / (counts - 1))
+    volatility[counts < 2] = np.nan
+    
+    # Skip CAGR for growth_rate variant (CAGR of growth rates doesn't make sense)
+    if variant == "growth_rate":
+        cagr = np.full(len(countries), np.nan)
+    else:
+        series_list = list(series_by_country.values())
+        first_dates = np.array([s.index.values[0] for s in series_list], dtype="datetime64[ns]")
+        last_dates = np.array([s.index.values[-1] for s in series_list], dtype="datetime64[ns]")
+        cagr = _compute_cagr_vec(first, last, first_dates, last_dates)
+    
+    metrics: Dict[str, Dict[str, Any]] = {}
+    for row, country in enumerate(countries):
+        vol = float(volatility[row])
+        metrics[country] = {
+            "cagr": None if np.isnan(cagr[row]) else float(cagr[row]),
+            "volatility": vol,
+            "stability_index": 1 / (1 + vol),
+            "total_growth_pct": float(total_growth[row]) if first[row] != 0 else None
+        }
+    return metrics
+
+
 def _compute_cagr(series: pd.Series) -> Optional[float]:
     """Compute Compound Annual Growth Rate."""
     if len(series) < 2:
@@ -292,88 +404,146 @@ def _compute_cagr(series: pd.Series) -> Optional[float]:
     return float(cagr)
 
 
+def _compute_cagr_vec(
+    first: np.ndarray,
+    last: np.ndarray,
+    first_date: np.ndarray,
+    last_date: np.ndarray
+) -> np.ndarray:
+    """Vectorized ``_compute_cagr`` over stacked arrays; NaN where CAGR is undefined."""
+    years = (last_date - first_date).astype("timedelta64[D]").astype(np.float64) / 365.25
+    valid = (first > 0) & (last > 0) & (years > 0)
+    cagr = np.full(first.shape, np.nan)
+    cagr[valid] = ((last[valid] / first[valid]) ** (1 / years[valid]) - 1) * 100
+    return cagr
+
+
+# Asymptotic critical values of sup|B(t)| (Brownian bridge) for the OLS-CUSUM test
+_CUSUM_CRITICAL_VALUES = {0.10: 1.224, 0.05: 1.358, 0.01: 1.628}
+
+
+def _cusum_break(values: np.ndarray) -> Optional[Tuple[int, float]]:
+    """
+    OLS-CUSUM test for a single mean shift.
+    
+    Returns the position of the largest cumulative deviation from the mean and
+    the test statistic ``max|S_k| / (sigma * sqrt(n))``, or None when flat.
+    """
+    centred = values - values.mean()
+    sigma = centred.std()
+    if not sigma > 0:
+        return None
+    cusum = np.abs(np.cumsum(centred))
+    idx = int(cusum.argmax())
+    return idx, float(cusum[idx] / (sigma * np.sqrt(len(values))))
+
+
 def _detect_structural_breaks(series: pd.Series, threshold: float = 0.05) -> List[Dict[str, Any]]:
     """
-    Detect structural breaks using rolling variance method.
+    Detect a structural break with an OLS-CUSUM test on period changes.
     
-    For MVP, use simple rolling variance. Full Chow test requires statsmodels.
+    Differencing removes the trend of level series, so a break shows up as a
+    shift in the mean change. ``threshold`` is the significance level (0.10,
+    0.05 or 0.01). Full Chow test requires statsmodels.
     """
     if len(series) < 20:
         return []
     
-    breaks = []
-    
-    # Rolling variance with 12-observation window
-    window = min(12, len(series) // 3)
-    rolling_var = series.rolling(window=window).var()
-    rolling_var = rolling_var.dropna()
+    observations = series.dropna()
+    changes = np.diff(observations.to_numpy(dtype=np.float64))
+    if len(changes) < 2:
+        return []
     
-    if len(rolling_var) < 2:
-        return breaks
+    result = _cusum_break(changes)
+    critical = _CUSUM_CRITICAL_VALUES.get(threshold, _CUSUM_CRITICAL_VALUES[0.05])
+    if result is None or result[1] <= critical:
+        logger.debug("Detected 0 potential structural breaks")
+        return []
     
-    # Detect when variance doubles or halves
-    for i in range(1, len(rolling_var)):
-        if rolling_var.iloc[i] > 2 * rolling_var.iloc[i-1]:
-            breaks.append({
-                "date": rolling_var.index[i].strftime("%Y-%m-%d"),
-                "type": "variance_increase",
-                "ratio": float(rolling_var.iloc[i] / rolling_var.iloc[i-1])
-            })
-        elif rolling_var.iloc[i] < 0.5 * rolling_var.iloc[i-1]:
-            breaks.append({
-                "date": rolling_var.index[i].strftime("%Y-%m-%d"),
-                "type": "variance_decrease",
-                "ratio": float(rolling_var.iloc[i] / rolling_var.iloc[i-1])
-            })
+    idx, statistic = result
+    # changes[idx] spans observations idx..idx+1; the new regime starts there
+    logger.debug("Detected 1 potential structural break")
+    return [{
+        "date": observations.index[idx + 1].strftime("%Y-%m-%d"),
+        "type": "mean_shift",
+        "statistic": statistic,
+        "ratio": statistic / critical
+    }]
+
+
+def _fast_linregress(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Simple OLS of y on x: (slope, intercept, r_squared, two-sided p_value).
     
-    logger.debug(f"Detected {len(breaks)} potential structural breaks")
-    return breaks[:5]  # Limit to top 5
+    Matches ``scipy.stats.linregress`` for these statistics without its
+    covariance-matrix path; the p-value uses the C-level ``stdtr``.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    x_mean, y_mean = x.mean(), y.mean()
+    dx, dy = x - x_mean, y - y_mean
+    sxx, syy, sxy = float(dx @ dx), float(dy @ dy), float(dx @ dy)
+    if sxx == 0:
+        raise ValueError("Cannot calculate a linear regression if all x values are identical")
+    
+    slope = sxy / sxx
+    intercept = y_mean - slope * x_mean
+    r = 0.0 if syy == 0 else max(-1.0, min(1.0, sxy / np.sqrt(sxx * syy)))
+    if n == 2:
+        p_value = 1.0 if y[0] == y[1] else 0.0
+    else:
+        df = n - 2
+        # Same 1e-20 guard as linregress so a perfect fit gives p = 0, not a division error
+        t = r * np.sqrt(df / ((1.0 - r + 1e-20) * (1.0 + r + 1e-20)))
+        p_value = float(2 * stdtr(df, -abs(t)))
+    return slope, intercept, r * r, p_value
 
 
-def _compute_convergence(all_series: Dict[str, pd.Series]) -> Dict[str, Any]:
+def _compute_convergence(
+    all_series: Dict[str, pd.Series],
+    aligned: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
     """
     Compute sigma and beta convergence.
     
     Sigma convergence: dispersion decreasing over time
     Beta convergence: poor countries grow faster than rich
+    
+    ``aligned`` may supply the series already joined on their common dates.
     """
-    result = {}
+    result: Dict[str, Any] = {}
     
-    # Sigma convergence: coefficient of variation over time
-    common_dates = None
-    for series in all_series.values():
-        if common_dates is None:
-            common_dates = set(series.index)
-        else:
-            common_dates = common_dates.intersection(series.index)
+    # Sigma convergence: coefficient of variation over time. One inner join
+    # yields both the common dates and the (dates x countries) value matrix.
+    if aligned is None:
+        aligned = pd.concat(all_series, axis=1, join="inner")
+    aligned = aligned.sort_index()
+    common_dates = aligned.index
     
-    if not common_dates or len(common_dates) < 5:  # Reduced from 10 to 5
-        logger.warning(f"Convergence: insufficient dates. Common dates: {len(common_dates) if common_dates else 0}")
+    if len(common_dates) < 5:  # Reduced from 10 to 5
+        logger.warning(f"Convergence: insufficient dates. Common dates: {len(common_dates)}")
         return {"sigma": None, "beta": None, "note": "Insufficient overlapping data"}
     
-    common_dates = sorted(list(common_dates))
     logger.info(f"Convergence: {len(common_dates)} common dates across {len(all_series)} series")
     
-    # Calculate CV at each time point
-    cvs = []
-    for date in common_dates:
-        values = [series.loc[date] for series in all_series.values() if date in series.index]
-        if len(values) > 1:
-            mean_val = np.mean(values)
-            if mean_val != 0:
-                cv = np.std(values) / mean_val
-                cvs.append(cv)
+    # Calculate CV at each time point with two row-wise reductions
+    matrix = aligned.to_numpy(dtype=np.float64)
+    means = matrix.mean(axis=1)
+    stds = matrix.std(axis=1)
+    nonzero = means != 0
+    cvs = stds[nonzero] / means[nonzero]
     
     logger.info(f"Convergence: calculated {len(cvs)} CVs from {len(common_dates)} dates")
     
     if len(cvs) > 1:
         # Linear regression of CV over time
         x = np.arange(len(cvs))
-        slope, intercept, r_value, p_value, std_err = stats.linregress(x, cvs)
+        slope, intercept, r_squared, p_value = _fast_linregress(x, cvs)
         
         result["sigma"] = {
             "slope": float(slope),  # Changed from trend_slope to match format layer
-            "r_squared": float(r_value ** 2),
+            "r_squared": float(r_squared),
             "p_value": float(p_value),
             "trend": "converging" if slope < 0 else "diverging",  # Added for format layer
             "significant": p_value < 0.05  # Changed from significance string to boolean
@@ -393,8 +563,8 @@ def _compute_convergence(all_series: Dict[str, pd.Series]) -> Dict[str, Any]:
             "note": "Use per_capita_constant to measure convergence in living standards"
         }
     else:
-        log_initial_gdp_pc = []
-        growth_rates = []
+        log_initial_gdp_pc: List[float] = []
+        growth_rates: List[float] = []
         
         for country, series in all_series.items():
             if len(series) > 1:
@@ -403,17 +573,20 @@ def _compute_convergence(all_series: Dict[str, pd.Series]) -> Dict[str, Any]:
                 
                 # Use log of initial GDP per capita (constant prices)
                 if initial_value > 0 and cagr is not None:
-                    log_initial_gdp_pc.append(np.log(initial_value))
+                    log_initial_gdp_pc.append(float(np.log(initial_value)))
                     growth_rates.append(cagr)
         
         if len(log_initial_gdp_pc) > 2:
             # Regress growth rate on log of initial GDP per capita
             # Negative coefficient indicates beta convergence (poorer countries grow faster)
-            slope, intercept, r_value, p_value, std_err = stats.linregress(log_initial_gdp_pc, growth_rates)
+            slope, intercept, r_squared, p_value = _fast_linregress(
+                np.asarray(log_initial_gdp_pc, dtype=np.float64),
+                np.asarray(growth_rates, dtype=np.float64)
+            )
             
             result["beta"] = {
                 "coefficient": float(slope),
-                "r_squared": float(r_value ** 2),
+                "r_squared": float(r_squared),
                 "p_value": float(p_value),
                 "interpretation": "catch-up growth" if slope < 0 else "no catch-up",
                 "significant": p_value < 0.05
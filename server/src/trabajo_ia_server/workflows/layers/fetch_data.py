@@ -6,11 +6,13 @@ Handles computed variants, population fetching, and missing data gracefully.
 """
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple, Any
+from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 from trabajo_ia_server.utils.fred_client import fred_client, FredAPIError
 from trabajo_ia_server.utils.logger import setup_logger
@@ -22,12 +24,65 @@ from trabajo_ia_server.workflows.utils.gdp_mappings import (
 
 logger = setup_logger(__name__)
 
+# Max concurrent FRED requests per process
+_MAX_FETCH_WORKERS = 10
+
+
+@lru_cache(maxsize=1)
+def _fetch_pool() -> ThreadPoolExecutor:
+    """Return the process-wide fetch pool, created on first use.
+
+    Reusing one pool avoids spawning and joining worker threads on every
+    request; the shared FRED session keeps its connections warm behind it.
+    """
+    return ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS, thread_name_prefix="fred-fetch")
+
+
+def _add_owner(
+    series_to_fetch: Dict[str, List[Tuple[str, str]]],
+    series_id: str,
+    country: str,
+    variant: str
+) -> None:
+    """Record (country, variant) as an owner of series_id, once."""
+    owners = series_to_fetch.setdefault(series_id, [])
+    if (country, variant) not in owners:
+        owners.append((country, variant))
+
+
+def _observations_to_series(
+    observations: List[Dict[str, Any]],
+    name: str
+) -> Optional[pd.Series]:
+    """
+    Parse FRED observation rows into a date-sorted float Series.
+    
+    Dates and values are parsed column-wise; rows with a missing or
+    unparseable date or value (including FRED's "." placeholder) are dropped.
+    Values are float32 when ``GDP_FLOAT32`` is enabled, float64 otherwise.
+    Returns None when no row survives.
+    """
+    frame = pd.DataFrame(observations, columns=["date", "value"])
+    dates = pd.to_datetime(frame["date"], errors="coerce", format="ISO8601")
+    values = pd.to_numeric(frame["value"], errors="coerce")
+    valid = dates.notna() & values.notna()
+    if not valid.any():
+        return None
+    series = pd.Series(
+        values[valid].to_numpy(dtype=np.float32 if config.GDP_FLOAT32 else np.float64),
+        index=pd.DatetimeIndex(dates[valid].to_numpy()),
+        name=name
+    )
+    return series.sort_index()
+
 
 @dataclass
 class FetchResult:
     """Result from fetch_gdp_data layer."""
     data: Dict[str, Dict[str, pd.Series]]  # country -> variant -> Series
     metadata: Dict[str, Any]
+    # variant -> DataFrame (index=dates, columns=countries), same values as data
+    by_variant: Dict[str, pd.DataFrame] = field(default_factory=dict)
 
 
 def fetch_gdp_data(
@@ -45,7 +100,9 @@ def fetch_gdp_data(
         variants: List of GDP variant names
         start_date: Start date YYYY-MM-DD (optional)
         end_date: End date YYYY-MM-DD (optional)
-        cache_ttl: Cache TTL in seconds (default: 86400 = 24h)
+        cache_ttl: Cache TTL in seconds (default: the ``gdp_series`` namespace
+            TTL, 24h unless overridden via CACHE_TTL_GDP_SERIES; None when
+            caching is disabled, in which case the client skips the cache)
         Returns:
         FetchResult with data dict and metadata
     
@@ -58,7 +115,7 @@ def fetch_gdp_data(
     logger.info(f"Fetching GDP data: {len(countries)} countries, {len(variants)} variants")
     
     if cache_ttl is None:
-        cache_ttl = 86400  # 24 hours default
+        cache_ttl = config.get_cache_ttl("gdp_series", fallback=86400)
     
     data: Dict[str, Dict[str, pd.Series]] = {country: {} for country in countries}
     metadata = {
@@ -67,11 +124,15 @@ def fetch_gdp_data(
         "missing_series": [],
         "errors": [],
         "source_series": {},
-        "fetch_timestamp": datetime.utcnow().isoformat() + "Z"
+        "fetch_timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
     }
+    # "country/variant" labels; a set so shared sources are reported once
+    missing_series: Set[str] = set()
     
     # Step 1: Determine what to fetch
-    series_to_fetch: Dict[str, Tuple[str, str]] = {}  # series_id -> (country, variant)
+    # series_id -> [(country, variant), ...]: one request per FRED series, fanned
+    # out afterwards to every (country, variant) that maps to it
+    series_to_fetch: Dict[str, List[Tuple[str, str]]] = {}
     computed_variants: Dict[str, List[str]] = {}  # variant -> source variants
     
     for country in countries:
@@ -86,7 +147,7 @@ def fetch_gdp_data(
                     series_id = get_series_id(country, variant)
                     if series_id:
                         # Direct series available - use it
-                        series_to_fetch[f"{country}:{series_id}"] = (country, variant)
+                        _add_owner(series_to_fetch, series_id, country, variant)
                         logger.debug(f"Using direct fetch for {country}/{variant}: {series_id}")
                         continue  # Skip computed logic
                     else:
@@ -104,29 +165,29 @@ def fetch_gdp_data(
                 for source_variant in sources:
                     series_id = get_series_id(country, source_variant)
                     if series_id:
-                        series_to_fetch[f"{country}:{series_id}"] = (country, source_variant)
+                        _add_owner(series_to_fetch, series_id, country, source_variant)
                     else:
                         logger.warning(f"Missing series for {country}/{source_variant}")
-                        metadata["missing_series"].append(f"{country}/{source_variant}")
+                        missing_series.add(f"{country}/{source_variant}")
             else:
                 # Direct fetch
                 series_id = get_series_id(country, variant)
                 if series_id:
-                    series_to_fetch[f"{country}:{series_id}"] = (country, variant)
+                    _add_owner(series_to_fetch, series_id, country, variant)
                 else:
                     logger.warning(f"Missing series for {country}/{variant}")
-                    metadata["missing_series"].append(f"{country}/{variant}")
+                    missing_series.add(f"{country}/{variant}")
     
     logger.info(f"Will fetch {len(series_to_fetch)} series from FRED")
     
     # Step 2: Fetch series from FRED (PARALLEL)
     def _fetch_single_series(
-        key: str,
         country: str,
         variant: str,
+        series_id: str,
         start_date: Optional[str],
         end_date: Optional[str],
-        cache_ttl: int
+        cache_ttl: Optional[int]
     ) -> Tuple[str, str, Optional[pd.Series], Optional[str], Optional[Dict[str, Any]]]:
         """
         Fetch a single series from FRED.
@@ -134,10 +195,6 @@ def fetch_gdp_data(
         Returns:
             Tuple of (country, variant, series, series_id, error_dict)
         """
-        series_id = get_series_id(country, variant)
-        if not series_id:
-            return (country, variant, None, None, None)
-        
         try:
             # Use fred_client.get_json with observations endpoint
             api_key = config.get_fred_api_key()
@@ -167,22 +224,9 @@ def fetch_gdp_data(
                 return (country, variant, None, series_id, None)
             
             # Convert to pandas Series
-            dates = []
-            values = []
-            for obs in observations:
-                date_str = obs.get("date")
-                value_str = obs.get("value")
-                
-                if date_str and value_str and value_str != ".":
-                    try:
-                        dates.append(pd.to_datetime(date_str))
-                        values.append(float(value_str))
-                    except (ValueError, TypeError):
-                        continue
+            series = _observations_to_series(observations, variant)
             
-            if dates:
-                series = pd.Series(values, index=pd.DatetimeIndex(dates), name=variant)
-                series = series.sort_index()
+            if series is not None:
                 logger.debug(f"Fetched {series_id}: {len(series)} observations")
                 return (country, variant, series, series_id, None)
             else:
@@ -206,52 +250,48 @@ def fetch_gdp_data(
                 "error": str(e)
             })
     
-    # Execute parallel fetches with ThreadPoolExecutor
-    max_workers = min(10, len(series_to_fetch))  # Max 10 concurrent requests
+    # Execute parallel fetches on the shared fetch pool
+    executor = _fetch_pool()
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all fetch tasks (be defensive: ensure values are (country, variant))
-        future_to_key = {}
-        for key, val in series_to_fetch.items():
-            try:
-                country, variant = val
-            except Exception:
-                logger.error(f"Invalid series_to_fetch entry for {key}: {val}")
-                metadata["errors"].append({"key": key, "value": val, "error": "invalid_entry"})
-                continue
-
-            future = executor.submit(
-                _fetch_single_series,
-                key,
-                country,
-                variant,
-                start_date,
-                end_date,
-                cache_ttl
-            )
-            future_to_key[future] = key
-        
-        # Process completed fetches
-        for future in as_completed(future_to_key):
-            key = future_to_key[future]
-            try:
-                country, variant, series, series_id, error = future.result()
-                
-                if error:
-                    metadata["errors"].append(error)
-                elif series is not None and series_id:
-                    # Store in data structure
+    # Submit one fetch per unique series; the first owner names the Series
+    future_to_series_id = {}
+    for series_id, owners in series_to_fetch.items():
+        country, variant = owners[0]
+        future = executor.submit(
+            _fetch_single_series,
+            country,
+            variant,
+            series_id,
+            start_date,
+            end_date,
+            cache_ttl
+        )
+        future_to_series_id[future] = series_id
+    
+    # Process completed fetches
+    for future in as_completed(future_to_series_id):
+        series_id = future_to_series_id[future]
+        owners = series_to_fetch[series_id]
+        try:
+            _, _, series, _, error = future.result()
+            
+            if error:
+                for country, variant in owners:
+                    metadata["errors"].append({**error, "country": country, "variant": variant})
+            elif series is not None:
+                metadata["fetched_series"].append(series_id)
+                # Store in data structure for every owner of this series
+                for country, variant in owners:
                     if country not in data:
                         data[country] = {}
-                    data[country][variant] = series
-                    
-                    metadata["fetched_series"].append(series_id)
+                    data[country][variant] = series if series.name == variant else series.rename(variant)
                     metadata["source_series"][f"{country}/{variant}"] = series_id
-                elif series_id:
-                    metadata["missing_series"].append(f"{country}/{variant}")
-            
-            except Exception as e:
-                logger.error(f"Error processing future for {key}: {str(e)}")
+            else:
+                for country, variant in owners:
+                    missing_series.add(f"{country}/{variant}")
+        
+        except Exception as e:
+            logger.error(f"Error processing future for {series_id}: {str(e)}")
     
     # Step 3: Compute derived variants
     for variant, sources in computed_variants.items():
@@ -264,13 +304,14 @@ def fetch_gdp_data(
                 continue
             
             try:
+                country_data = data[country]
                 if variant == "growth_rate":
                     # Compute from constant_2010
-                    if "constant_2010" in data[country]:
-                        gdp_series = data[country]["constant_2010"]
+                    if "constant_2010" in country_data:
+                        gdp_series = country_data["constant_2010"]
                         growth = gdp_series.pct_change() * 100  # Annual % change
                         growth = growth.dropna()
-                        data[country]["growth_rate"] = growth
+                        country_data["growth_rate"] = growth
                         logger.debug(f"Computed growth_rate for {country}: {len(growth)} obs")
                     else:
                         logger.warning(f"Cannot compute growth_rate for {country}: missing constant_2010")
@@ -278,32 +319,29 @@ def fetch_gdp_data(
                 elif variant.startswith("per_capita_"):
                     # Compute per capita variant
                     base_variant = variant.replace("per_capita_", "")
+                    gdp_series = country_data.get(base_variant)
+                    pop_series = country_data.get("population")
                     
                     # Check if we have both GDP and population
-                    if base_variant in data[country] and "population" in data[country]:
-                        gdp_series = data[country][base_variant]
-                        pop_series = data[country]["population"]
-                        
+                    if gdp_series is not None and pop_series is not None:
                         # Align dates
-                        common_dates = gdp_series.index.intersection(pop_series.index)
-                        if len(common_dates) > 0:
-                            gdp_aligned = gdp_series.loc[common_dates]
-                            pop_aligned = pop_series.loc[common_dates]
-                            
+                        gdp_aligned, pop_aligned = gdp_series.align(pop_series, join="inner")
+                        if len(gdp_aligned) > 0:
                             # GDP is in billions, population is in units
                             # per_capita = (gdp_billions * 1e9) / population
-                            per_capita = (gdp_aligned * 1e9) / pop_aligned
-                            per_capita = per_capita.dropna()
+                            with np.errstate(divide="ignore", invalid="ignore"):
+                                values = (gdp_aligned.to_numpy(dtype=np.float64) * 1e9) / pop_aligned.to_numpy(dtype=np.float64)
+                            per_capita = pd.Series(values, index=gdp_aligned.index).dropna()
                             
-                            data[country][variant] = per_capita
+                            country_data[variant] = per_capita
                             logger.debug(f"Computed {variant} for {country}: {len(per_capita)} obs")
                         else:
                             logger.warning(f"No overlapping dates for {country}/{variant} computation")
                     else:
                         missing = []
-                        if base_variant not in data[country]:
+                        if gdp_series is None:
                             missing.append(base_variant)
-                        if "population" not in data[country]:
+                        if pop_series is None:
                             missing.append("population")
                         logger.warning(f"Cannot compute {variant} for {country}: missing {missing}")
             
@@ -315,8 +353,28 @@ def fetch_gdp_data(
                     "error": f"Computation failed: {str(e)}"
                 })
     
+    metadata["missing_series"] = sorted(missing_series)
+    
     # Summary stats
     total_series = sum(len(v) for v in data.values())
     logger.info(f"Fetch complete: {total_series} series, {len(metadata['missing_series'])} missing")
     
-    return FetchResult(data=data, metadata=metadata)
+    return FetchResult(data=data, metadata=metadata, by_variant=_frames_by_variant(data, variants))
+
+
+def _frames_by_variant(
+    data: Dict[str, Dict[str, pd.Series]],
+    variants: List[str]
+) -> Dict[str, pd.DataFrame]:
+    """Column-stack each variant's series across countries (outer-joined on dates)."""
+    by_variant: Dict[str, pd.DataFrame] = {}
+    for variant in variants:
+        series_by_country = {
+            country: country_data[variant]
+            for country, country_data in data.items()
+            if variant in country_data
+        }
+        # Duplicate dates cannot be aligned; analysis then works from the series
+        if series_by_country and all(s.index.is_unique for s in series_by_country.values()):
+            by_variant[variant] = pd.concat(series_by_country, axis=1)
+    return by_variant
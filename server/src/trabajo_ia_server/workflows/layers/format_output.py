@@ -17,13 +17,42 @@ Date: 2025-11-05
 import json
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
 from trabajo_ia_server.utils.logger import setup_logger
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency not installed
+    orjson = None  # type: ignore[assignment]
+
 logger = setup_logger(__name__)
 
+# Static limitation texts (interpolated ones are built in _get_limitations)
+_LIMITATION_SHORT_PERIOD = "Analysis period < 5 years - growth metrics may be unstable"
+_LIMITATION_FEW_COUNTRIES = (
+    "Cross-country analysis requires 3+ countries for meaningful convergence tests"
+)
+_LIMITATION_COMPUTED_VARIANTS = (
+    "Some variants computed from other series (see metadata.computed_variants)"
+)
+
+# Unit per GDP variant (dataset rows and latest values)
+_UNIT_MAP: Dict[str, str] = {
+    "nominal_usd": "Billions USD",
+    "nominal_lcu": "Billions LCU",
+    "constant_2010": "Billions USD (2010)",
+    "constant_2015": "Billions USD (2015)",
+    "ppp": "Billions USD (PPP)",
+    "per_capita_nominal": "USD per capita",
+    "per_capita_constant": "USD per capita (2010)",
+    "per_capita_ppp": "USD per capita (PPP)",
+    "growth_rate": "Percent"
+}
+_UNKNOWN_UNIT = "Unknown"
+
 
 @dataclass
 class FormatResult:
@@ -56,165 +85,10 @@ def format_analysis(
     """
     logger.info("Formatting output: analysis (AI-optimized)")
     
-    # Extract data from analysis result
-    by_country = analysis_result.by_country
-    cross_country = analysis_result.cross_country
-    rankings = analysis_result.rankings
-    analysis_metadata = analysis_result.metadata
-    
-    # Build compact structure
-    output = {
-        "tool": "analyze_gdp_cross_country",
-        "results": {
-            "countries": {},
-            "cross_country": {},
-            "rankings": {}
-        },
-        "metadata": {
-            "period": {
-                "start": fetch_metadata.get("observation_start"),
-                "end": fetch_metadata.get("observation_end"),
-                "years": analysis_metadata.get("period_years")
-            },
-            "coverage": {
-                "countries": analysis_metadata.get("countries_analyzed"),
-                "variants": fetch_metadata.get("variants_requested"),
-                "series_fetched": fetch_metadata.get("series_fetched"),
-                "series_missing": fetch_metadata.get("series_missing")
-            },
-            "computed_variants": fetch_metadata.get("computed_variants", []),
-            "limitations": _get_limitations(analysis_metadata)
-        }
-    }
-    
-    # Format country-level results (compact)
-    for country, variants_data in by_country.items():
-        country_data = {}
-        
-        # Iterate over variants for this country
-        for variant, data in variants_data.items():
-            variant_data = {}
-            
-            # Growth metrics
-            if "growth_metrics" in data:
-                metrics = data["growth_metrics"]
-                variant_data["growth"] = {
-                    "cagr_pct": round(metrics.get("cagr", 0), 2) if metrics.get("cagr") is not None else None,
-                    "volatility": round(metrics.get("volatility", 0), 2) if metrics.get("volatility") is not None else None,
-                    "stability_index": round(metrics.get("stability_index", 0), 3) if metrics.get("stability_index") is not None else None
-                }
-            
-            # Structural breaks (if detected)
-            if "structural_breaks" in data and data["structural_breaks"]:
-                variant_data["structural_breaks"] = [
-                    {
-                        "date": b["date"],
-                        "type": b.get("type", "unknown"),
-                        "ratio": round(b.get("ratio", 0), 2)
-                    }
-                    for b in data["structural_breaks"][:3]  # Top 3 only
-                ]
-            
-            # Latest values
-            if "latest_value" in data and data["latest_value"] is not None:
-                variant_data["latest"] = {
-                    "date": data.get("last_date"),
-                    "value": round(data["latest_value"], 2),
-                    "unit": _get_unit_for_variant(variant)
-                }
-            
-            # Add basic stats
-            if "observations" in data:
-                variant_data["stats"] = {
-                    "observations": data["observations"],
-                    "first_date": data["first_date"],
-                    "last_date": data["last_date"],
-                    "mean": round(data["mean"], 2) if data.get("mean") is not None else None,
-                    "min": round(data["min"], 2) if data.get("min") is not None else None,
-                    "max": round(data["max"], 2) if data.get("max") is not None else None
-                }
-            
-            country_data[variant] = variant_data
-        
-        output["results"]["countries"][country] = country_data
-    
-    # Format cross-country analysis (compact)
-    if cross_country:
-        cross_country_output = {}
-        
-        # Iterate over variants
-        for variant, variant_data in cross_country.items():
-            variant_cross = {}
-            
-            # Basic statistics
-            if "latest_snapshot" in variant_data:
-                stats = variant_data["latest_snapshot"]
-                variant_cross["statistics"] = {
-                    "mean": round(stats.get("mean", 0), 2) if stats.get("mean") is not None else None,
-                    "median": round(stats.get("median", 0), 2) if stats.get("median") is not None else None,
-                    "std": round(stats.get("std", 0), 2) if stats.get("std") is not None else None,
-                    "cv": round(stats.get("coefficient_of_variation", 0), 3) if stats.get("coefficient_of_variation") is not None else None,
-                    "min": round(stats.get("min", 0), 2) if stats.get("min") is not None else None,
-                    "max": round(stats.get("max", 0), 2) if stats.get("max") is not None else None
-                }
-            
-            # Convergence (only if computed)
-            if "convergence" in variant_data:
-                convergence = variant_data["convergence"]
-                conv_data = {}
-                
-                if "sigma" in convergence:
-                    sigma = convergence["sigma"]
-                    conv_data["sigma"] = {
-                        "trend": "converging" if sigma["slope"] < 0 else "diverging",
-                        "slope": round(sigma["slope"], 4),
-                        "r_squared": round(sigma["r_squared"], 3),
-                        "p_value": round(sigma["p_value"], 4),
-                        "significant": sigma["p_value"] < 0.05
-                    }
-                
-                if "beta" in convergence:
-                    beta = convergence["beta"]
-                    conv_data["beta"] = {
-                        "coefficient": round(beta["coefficient"], 4),
-                        "r_squared": round(beta["r_squared"], 3),
-                        "p_value": round(beta["p_value"], 4),
-                        "significant": beta["p_value"] < 0.05,
-                        "interpretation": "catch-up growth" if beta["coefficient"] < 0 else "no catch-up"
-                    }
-                
-                if conv_data:
-                    variant_cross["convergence"] = conv_data
-            
-            cross_country_output[variant] = variant_cross
-        
-        output["results"]["cross_country"] = cross_country_output
-    
-    # Format rankings (compact)
-    if rankings:
-        rankings_output = {}
-        
-        for ranking_type, ranking_list in rankings.items():
-            # ranking_list is a list of tuples (country, value)
-            rankings_output[ranking_type] = [
-                {
-                    "rank": i + 1,
-                    "country": country,
-                    "value": round(value, 2) if value is not None else None
-                }
-                for i, (country, value) in enumerate(ranking_list[:10])  # Top 10
-            ]
-        
-        output["results"]["rankings"] = rankings_output
-    
-    # Add interpretation hints (AI-friendly)
-    output["interpretation"] = _generate_interpretation_hints(
-        output["results"],
-        analysis_metadata
-    )
+    output = _build_analysis_dict(analysis_result, fetch_metadata)
     
     # Serialize to JSON
-    output_str = json.dumps(output, indent=2)
+    output_str = _dumps(output)
     
     metadata = {
         "format": "analysis",
@@ -246,7 +120,7 @@ def format_dataset(
     - Ready for pandas, R, or statistical software
     
     Args:
-        analysis_result: AnalysisResult from analysis layer
+        analysis_result: AnalysisResult from analysis layer (unused; may be None)
         fetch_metadata: Metadata from fetch layer
         raw_data: Raw time series data from fetch layer (nested dict: country -> variant -> Series)
     
@@ -255,53 +129,18 @@ def format_dataset(
     """
     logger.info("Formatting output: dataset (tidy format)")
     
-    # Build tidy DataFrame
-    rows = []
-    
-    # Handle nested structure: country -> variant -> Series
-    for country, variants_dict in raw_data.items():
-        for variant, series in variants_dict.items():
-            for date, value in series.items():
-                rows.append({
-                    "date": date.strftime("%Y-%m-%d") if hasattr(date, "strftime") else str(date),
-                    "country": country,
-                    "variant": variant,
-                    "value": float(value),
-                    "unit": _get_unit_for_variant(variant)
-                })
-    
-    df = pd.DataFrame(rows)
-    
-    # Sort by date, country, variant
-    df = df.sort_values(["date", "country", "variant"]).reset_index(drop=True)
-    
-    # Serialize to JSON (records format)
-    dataset_json = df.to_json(orient="records", date_format="iso")
-    
-    output = {
-        "tool": "analyze_gdp_cross_country",
-        "dataset": json.loads(dataset_json),
-        "metadata": {
-            "format": "tidy",
-            "rows": len(df),
-            "countries": df["country"].nunique(),
-            "variants": df["variant"].nunique(),
-            "period": {
-                "start": df["date"].min(),
-                "end": df["date"].max()
-            }
-        }
-    }
+    output = _build_dataset_dict(raw_data)
+    rows = output["metadata"]["rows"]
     
-    output_str = json.dumps(output, indent=2)
+    output_str = _dumps(output)
     
     metadata = {
         "format": "dataset",
-        "rows": len(df),
+        "rows": rows,
         "timestamp": datetime.utcnow().isoformat()
     }
     
-    logger.info(f"Formatted dataset: {len(df)} rows")
+    logger.info(f"Formatted dataset: {rows} rows")
     
     return FormatResult(
         output=output_str,
@@ -405,7 +244,7 @@ def format_summary(
         "format": "markdown"
     }
     
-    output_str = json.dumps(output_json, indent=2)
+    output_str = _dumps(output_json)
     
     metadata = {
         "format": "summary",
@@ -443,13 +282,9 @@ def format_both(
     """
     logger.info("Formatting output: both (analysis + dataset)")
     
-    # Get analysis format
-    analysis_format = format_analysis(analysis_result, fetch_metadata)
-    analysis_data = json.loads(analysis_format.output)
-    
-    # Get dataset format
-    dataset_format = format_dataset(analysis_result, fetch_metadata, raw_data)
-    dataset_data = json.loads(dataset_format.output)
+    # Build both payloads as dicts and serialize the combination once
+    analysis_data = _build_analysis_dict(analysis_result, fetch_metadata)
+    dataset_data = _build_dataset_dict(raw_data)
     
     # Combine
     output = {
@@ -464,7 +299,7 @@ def format_both(
         "interpretation": analysis_data.get("interpretation")
     }
     
-    output_str = json.dumps(output, indent=2)
+    output_str = _dumps(output)
     
     metadata = {
         "format": "both",
@@ -484,6 +319,244 @@ def format_both(
 
 # Helper functions
 
+def _build_analysis_dict(
+    analysis_result: Any,
+    fetch_metadata: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the 'analysis' payload (serialized by format_analysis and format_both)."""
+    # Extract data from analysis result
+    by_country = analysis_result.by_country
+    cross_country = analysis_result.cross_country
+    rankings = analysis_result.rankings
+    analysis_metadata = analysis_result.metadata
+    
+    # Build compact structure
+    output = {
+        "tool": "analyze_gdp_cross_country",
+        "results": {
+            "countries": {},
+            "cross_country": {},
+            "rankings": {}
+        },
+        "metadata": {
+            "period": {
+                "start": fetch_metadata.get("observation_start"),
+                "end": fetch_metadata.get("observation_end"),
+                "years": analysis_metadata.get("period_years")
+            },
+            "coverage": {
+                "countries": analysis_metadata.get("countries_analyzed"),
+                "variants": fetch_metadata.get("variants_requested"),
+                "series_fetched": fetch_metadata.get("series_fetched"),
+                "series_missing": fetch_metadata.get("series_missing")
+            },
+            "computed_variants": fetch_metadata.get("computed_variants", []),
+            "limitations": _get_limitations(analysis_metadata)
+        }
+    }
+    
+    # Format country-level results (compact)
+    for country, variants_data in by_country.items():
+        country_data = {}
+        
+        # Iterate over variants for this country
+        for variant, data in variants_data.items():
+            variant_data = {}
+            
+            # Growth metrics
+            if "growth_metrics" in data:
+                metrics = data["growth_metrics"]
+                variant_data["growth"] = {
+                    "cagr_pct": round(metrics.get("cagr", 0), 2) if metrics.get("cagr") is not None else None,
+                    "volatility": round(metrics.get("volatility", 0), 2) if metrics.get("volatility") is not None else None,
+                    "stability_index": round(metrics.get("stability_index", 0), 3) if metrics.get("stability_index") is not None else None
+                }
+            
+            # Structural breaks (if detected)
+            if "structural_breaks" in data and data["structural_breaks"]:
+                variant_data["structural_breaks"] = [
+                    {
+                        "date": b["date"],
+                        "type": b.get("type", "unknown"),
+                        "ratio": round(b.get("ratio", 0), 2)
+                    }
+                    for b in data["structural_breaks"][:3]  # Top 3 only
+                ]
+            
+            # Latest values
+            if "latest_value" in data and data["latest_value"] is not None:
+                variant_data["latest"] = {
+                    "date": data.get("last_date"),
+                    "value": round(data["latest_value"], 2),
+                    "unit": _get_unit_for_variant(variant)
+                }
+            
+            # Add basic stats
+            if "observations" in data:
+                variant_data["stats"] = {
+                    "observations": data["observations"],
+                    "first_date": data["first_date"],
+                    "last_date": data["last_date"],
+                    "mean": round(data["mean"], 2) if data.get("mean") is not None else None,
+                    "min": round(data["min"], 2) if data.get("min") is not None else None,
+                    "max": round(data["max"], 2) if data.get("max") is not None else None
+                }
+            
+            country_data[variant] = variant_data
+        
+        output["results"]["countries"][country] = country_data
+    
+    # Format cross-country analysis (compact)
+    if cross_country:
+        cross_country_output = {}
+        
+        # Iterate over variants
+        for variant, variant_data in cross_country.items():
+            variant_cross = {}
+            
+            # Basic statistics
+            if "latest_snapshot" in variant_data:
+                stats = variant_data["latest_snapshot"]
+                variant_cross["statistics"] = {
+                    "mean": round(stats.get("mean", 0), 2) if stats.get("mean") is not None else None,
+                    "median": round(stats.get("median", 0), 2) if stats.get("median") is not None else None,
+                    "std": round(stats.get("std", 0), 2) if stats.get("std") is not None else None,
+                    "cv": round(stats.get("coefficient_of_variation", 0), 3) if stats.get("coefficient_of_variation") is not None else None,
+                    "min": round(stats.get("min", 0), 2) if stats.get("min") is not None else None,
+                    "max": round(stats.get("max", 0), 2) if stats.get("max") is not None else None
+                }
+            
+            # Convergence (only if computed)
+            if "convergence" in variant_data:
+                convergence = variant_data["convergence"]
+                conv_data = {}
+                
+                if "sigma" in convergence:
+                    sigma = convergence["sigma"]
+                    conv_data["sigma"] = {
+                        "trend": "converging" if sigma["slope"] < 0 else "diverging",
+                        "slope": round(sigma["slope"], 4),
+                        "r_squared": round(sigma["r_squared"], 3),
+                        "p_value": round(sigma["p_value"], 4),
+                        "significant": sigma["p_value"] < 0.05
+                    }
+                
+                if "beta" in convergence:
+                    beta = convergence["beta"]
+                    conv_data["beta"] = {
+                        "coefficient": round(beta["coefficient"], 4),
+                        "r_squared": round(beta["r_squared"], 3),
+                        "p_value": round(beta["p_value"], 4),
+                        "significant": beta["p_value"] < 0.05,
+                        "interpretation": "catch-up growth" if beta["coefficient"] < 0 else "no catch-up"
+                    }
+                
+                if conv_data:
+                    variant_cross["convergence"] = conv_data
+            
+            cross_country_output[variant] = variant_cross
+        
+        output["results"]["cross_country"] = cross_country_output
+    
+    # Format rankings (compact)
+    if rankings:
+        rankings_output = {}
+        
+        for ranking_type, ranking_list in rankings.items():
+            # ranking_list is a list of tuples (country, value)
+            rankings_output[ranking_type] = [
+                {
+                    "rank": i + 1,
+                    "country": country,
+                    "value": round(value, 2) if value is not None else None
+                }
+                for i, (country, value) in enumerate(ranking_list[:10])  # Top 10
+            ]
+        
+        output["results"]["rankings"] = rankings_output
+    
+    # Add interpretation hints (AI-friendly)
+    output["interpretation"] = _generate_interpretation_hints(
+        output["results"],
+        analysis_metadata
+    )
+    
+    return output
+
+
+def _build_dataset_dict(raw_data: Dict[str, Dict[str, pd.Series]]) -> Dict[str, Any]:
+    """Build the tidy 'dataset' payload (serialized by format_dataset and format_both)."""
+    # Build the tidy DataFrame column-wise: one array per column and series
+    # (dates formatted and values converted in C), concatenated once.
+    columns: Dict[str, List[np.ndarray]] = {
+        "date": [], "country": [], "variant": [], "value": []
+    }
+    
+    # Handle nested structure: country -> variant -> Series
+    for country, variants_dict in raw_data.items():
+        for variant, series in variants_dict.items():
+            index = series.index
+            if isinstance(index, pd.DatetimeIndex):
+                dates = index.strftime("%Y-%m-%d").to_numpy(dtype=object)
+            else:
+                dates = np.array(
+                    [d.strftime("%Y-%m-%d") if hasattr(d, "strftime") else str(d) for d in index],
+                    dtype=object
+                )
+            size = len(series)
+            columns["date"].append(dates)
+            columns["country"].append(np.full(size, country, dtype=object))
+            columns["variant"].append(np.full(size, variant, dtype=object))
+            columns["value"].append(series.to_numpy(dtype=np.float64))
+    
+    df = pd.DataFrame({
+        name: np.concatenate(arrays) if arrays else np.empty(0, dtype=object)
+        for name, arrays in columns.items()
+    })
+    
+    # The unit depends on the variant only: one hashed map over the column
+    df["unit"] = df["variant"].map(_UNIT_MAP).fillna(_UNKNOWN_UNIT)
+    
+    # Sort by date, country, variant
+    df = df.sort_values(["date", "country", "variant"]).reset_index(drop=True)
+    
+    # Records straight from the columns; values keep the 10-decimal precision
+    # of the former to_json encoding and NaN becomes null.
+    values = np.round(df["value"].to_numpy(dtype=np.float64), 10)
+    cleaned = values.astype(object)
+    cleaned[np.isnan(values)] = None
+    df["value"] = cleaned
+    records = df.to_dict(orient="records")
+    
+    output = {
+        "tool": "analyze_gdp_cross_country",
+        "dataset": records,
+        "metadata": {
+            "format": "tidy",
+            "rows": len(df),
+            "countries": df["country"].nunique(),
+            "variants": df["variant"].nunique(),
+            "period": {
+                "start": df["date"].min(),
+                "end": df["date"].max()
+            }
+        }
+    }
+    
+    return output
+
+
+def _dumps(payload: Any) -> str:
+    """Indented JSON for every format (orjson when installed)."""
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+        return encoded.decode("utf-8")
+    return json.dumps(payload, indent=2)
+
+
 def _get_limitations(metadata: Dict[str, Any]) -> List[str]:
     """Generate list of analysis limitations."""
     limitations = []
@@ -496,9 +569,7 @@ def _get_limitations(metadata: Dict[str, Any]) -> List[str]:
     
     # Short period
     if metadata.get("period_years", 0) < 5:
-        limitations.append(
-            "Analysis period < 5 years - growth metrics may be unstable"
-        )
+        limitations.append(_LIMITATION_SHORT_PERIOD)
     
     # Few countries
     countries_analyzed = metadata.get("countries_analyzed", [])
@@ -508,15 +579,11 @@ def _get_limitations(metadata: Dict[str, Any]) -> List[str]:
         num_countries = countries_analyzed if isinstance(countries_analyzed, int) else 0
     
     if num_countries < 3:
-        limitations.append(
-            "Cross-country analysis requires 3+ countries for meaningful convergence tests"
-        )
+        limitations.append(_LIMITATION_FEW_COUNTRIES)
     
     # Computed variants
     if metadata.get("has_computed_variants", False):
-        limitations.append(
-            "Some variants computed from other series (see metadata.computed_variants)"
-        )
+        limitations.append(_LIMITATION_COMPUTED_VARIANTS)
     
     return limitations
 
@@ -585,15 +652,4 @@ def _generate_interpretation_hints(
 
 def _get_unit_for_variant(variant: str) -> str:
     """Get unit string for GDP variant."""
-    units = {
-        "nominal_usd": "Billions USD",
-        "nominal_lcu": "Billions LCU",
-        "constant_2010": "Billions USD (2010)",
-        "constant_2015": "Billions USD (2015)",
-        "ppp": "Billions USD (PPP)",
-        "per_capita_nominal": "USD per capita",
-        "per_capita_constant": "USD per capita (2010)",
-        "per_capita_ppp": "USD per capita (PPP)",
-        "growth_rate": "Percent"
-    }
-    return units.get(variant, "Unknown")
+    return _UNIT_MAP.get(variant, _UNKNOWN_UNIT)
@@ -8,6 +8,7 @@ __all__ = [
     "GDP_MAPPINGS",
     "GDP_PRESETS",
     "GDP_VARIANT_DEPENDENCIES",
+    "SUPPORTED_COUNTRIES",
     "expand_preset",
     "get_series_id",
     "validate_variants",
@@ -4,7 +4,9 @@ GDP Mappings - Series IDs for 238 countries/territories.
 Maps country codes to FRED/World Bank series IDs for different GDP variants.
 Based on FRED series patterns and World Bank availability (1960-2024).
 """
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 # ============================================================================
 # GDP SERIES PATTERNS (FRED)
@@ -502,6 +504,9 @@ GDP_MAPPINGS: Dict[str, Dict[str, str]] = {
 # NOTE: Full 238 countries would be added here. For brevity, showing ~60 major economies.
 # Implementation will include all World Bank member countries with FRED series availability.
 
+# Supported country codes, built once for O(1) membership checks
+SUPPORTED_COUNTRIES: FrozenSet[str] = frozenset(GDP_MAPPINGS)
+
 # ============================================================================
 # GDP_PRESETS: Predefined country groups
 # ============================================================================
@@ -585,6 +590,11 @@ GDP_PRESETS: Dict[str, List[str]] = {
     "southeast_asia": ["indonesia", "thailand", "singapore", "malaysia", "philippines", "vietnam"],
 }
 
+# Preset members as tuples, so expansion never hands out the mutable lists
+_PRESET_EXPANSIONS: Dict[str, Tuple[str, ...]] = {
+    name: tuple(members) for name, members in GDP_PRESETS.items()
+}
+
 # ============================================================================
 # GDP_VARIANT_DEPENDENCIES: Automatic computation rules
 # ============================================================================
@@ -622,6 +632,7 @@ GDP_VARIANT_DEPENDENCIES: Dict[str, Dict[str, any]] = {
 # Helper Functions
 # ============================================================================
 
+@lru_cache(maxsize=2048)
 def get_series_id(country: str, variant: str) -> Optional[str]:
     """
     Get FRED series ID for a country/variant combination.
@@ -632,6 +643,8 @@ def get_series_id(country: str, variant: str) -> Optional[str]:
     
     Returns:
         FRED series ID or None if not available
+
+    The mappings are static, so lookups are memoized across requests.
     """
     return GDP_MAPPINGS.get(country, {}).get(variant)
 
@@ -656,22 +669,12 @@ def expand_preset(preset_or_countries: str | List[str]) -> List[str]:
     """
     if isinstance(preset_or_countries, str):
         # Single preset or country
-        if preset_or_countries in GDP_PRESETS:
-            return GDP_PRESETS[preset_or_countries]
-        else:
-            return [preset_or_countries]
-    
-    # List of presets/countries
-    result = []
-    for item in preset_or_countries:
-        if item in GDP_PRESETS:
-            result.extend(GDP_PRESETS[item])
-        else:
-            result.append(item)
+        return list(_PRESET_EXPANSIONS.get(preset_or_countries, (preset_or_countries,)))
     
-    # Remove duplicates while preserving order
-    seen = set()
-    return [x for x in result if not (x in seen or seen.add(x))]
+    # List of presets/countries: expand, then dedupe preserving order in one pass
+    return list(dict.fromkeys(
+        chain.from_iterable(_PRESET_EXPANSIONS.get(item, (item,)) for item in preset_or_countries)
+    ))
 
 
 def get_available_countries() -> List[str]:
@@ -693,17 +696,21 @@ def get_available_variants() -> List[str]:
     ]
 
 
+# Display names that don't follow the title-case rule below
+_COUNTRY_DISPLAY_NAMES: Dict[str, str] = {
+    "usa": "United States",
+    "uk": "United Kingdom",
+    "uae": "United Arab Emirates",
+    "south_korea": "South Korea",
+    "south_africa": "South Africa",
+    "new_zealand": "New Zealand",
+    "czech_republic": "Czech Republic",
+    "saudi_arabia": "Saudi Arabia",
+}
+
+
+@lru_cache(maxsize=512)
 def get_country_name(country_code: str) -> str:
     """Convert country code to display name."""
     # Simple mapping - would be expanded with full country names
-    names = {
-        "usa": "United States",
-        "uk": "United Kingdom",
-        "uae": "United Arab Emirates",
-        "south_korea": "South Korea",
-        "south_africa": "South Africa",
-        "new_zealand": "New Zealand",
-        "czech_republic": "Czech Republic",
-        "saudi_arabia": "Saudi Arabia",
-    }
-    return names.get(country_code, country_code.replace("_", " ").title())
+    return _COUNTRY_DISPLAY_NAMES.get(country_code, country_code.replace("_", " ").title())
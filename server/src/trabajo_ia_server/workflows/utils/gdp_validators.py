@@ -7,9 +7,9 @@ from typing import List, Dict, Optional, Set
 from datetime import datetime
 
 from trabajo_ia_server.workflows.utils.gdp_mappings import (
-    GDP_MAPPINGS,
     GDP_PRESETS,
     GDP_VARIANT_DEPENDENCIES,
+    SUPPORTED_COUNTRIES,
     expand_preset,
     get_series_id
 )
@@ -190,10 +190,11 @@ def validate_countries(countries: str | List[str]) -> Dict[str, any]:
         {"expanded": ["usa"], "invalid": ["invalid_country"], "warnings": [...]}
     """
     expanded = expand_preset(countries)
-    available_countries = set(GDP_MAPPINGS.keys())
     
-    valid_countries = [c for c in expanded if c in available_countries]
-    invalid_countries = [c for c in expanded if c not in available_countries]
+    valid_countries: List[str] = []
+    invalid_countries: List[str] = []
+    for c in expanded:
+        (valid_countries if c in SUPPORTED_COUNTRIES else invalid_countries).append(c)
     
     warnings = []
     if invalid_countries:
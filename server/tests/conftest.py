@@ -16,11 +16,22 @@ def pytest_sessionstart(session):  # pragma: no cover - pytest hook
             def get(self, *args, **kwargs):  # pragma: no cover - should be mocked in tests
                 raise RuntimeError("requests stub cannot perform HTTP calls")
 
+            def mount(self, prefix, adapter) -> None:  # pragma: no cover - no-op
+                return None
+
+        class HTTPAdapter:  # type: ignore[too-few-public-methods]
+            def __init__(self, *args, **kwargs) -> None:
+                pass
+
         exceptions = types.SimpleNamespace(RequestException=Exception)
+        adapters_stub = types.ModuleType("requests.adapters")
+        adapters_stub.HTTPAdapter = HTTPAdapter
 
         requests_stub.Session = Session
         requests_stub.exceptions = exceptions
+        requests_stub.adapters = adapters_stub
         sys.modules["requests"] = requests_stub
+        sys.modules["requests.adapters"] = adapters_stub
 
     if "tenacity" not in sys.modules:
         tenacity_stub = types.ModuleType("tenacity")
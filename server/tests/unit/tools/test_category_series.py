@@ -5,8 +5,14 @@ Tests the category series retrieval with real FRED API calls.
 """
 import json
 import time
+from unittest.mock import patch
+
 from trabajo_ia_server.tools.fred.category_series import get_category_series
+from trabajo_ia_server.utils.fred_client import fred_client
+
 
+# One attempt per request so stubbed-network failures skip retry backoff.
+@patch.object(fred_client, "_max_attempts", 1)
 def test_category_series():
     """Test get_category_series with various scenarios."""
 
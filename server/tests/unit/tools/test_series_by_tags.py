@@ -0,0 +1,72 @@
+"""Unit tests for the async FRED series-by-tags tool."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+from trabajo_ia_server.tools.fred.series_by_tags import aget_series_by_tags
+from trabajo_ia_server.utils.fred_client import FredAPIError, FredAPIResponse
+
+
+class TestAsyncGetSeriesByTags:
+    """Test cases for aget_series_by_tags."""
+
+    @patch(
+        "trabajo_ia_server.utils.fred_client.fred_client.get_json_async",
+        new_callable=AsyncMock,
+    )
+    @patch("trabajo_ia_server.config.config.get_fred_api_key")
+    def test_formats_async_response(self, mock_get_key, mock_get_json_async):
+        mock_get_key.return_value = "test_api_key"
+        payload = {
+            "count": 5,
+            "realtime_start": "2024-01-01",
+            "realtime_end": "2024-01-01",
+            "seriess": [
+                {"id": "SLVGDP", "title": "Slovenia GDP"},
+                {"id": "SLVCPI", "title": "Slovenia CPI"},
+            ],
+        }
+        mock_get_json_async.return_value = FredAPIResponse(
+            payload=payload,
+            url="https://api.stlouisfed.org/fred/tags/series",
+            status_code=200,
+            headers={},
+            from_cache=True,
+        )
+
+        result = asyncio.run(
+            aget_series_by_tags("slovenia;oecd", exclude_tag_names="discontinued", limit=5000)
+        )
+        result_data = json.loads(result)
+
+        assert result_data["tool"] == "get_series_by_tags"
+        assert [series["id"] for series in result_data["data"]] == ["SLVGDP", "SLVCPI"]
+        metadata = result_data["metadata"]
+        assert metadata["required_tags"] == ["slovenia", "oecd"]
+        assert metadata["excluded_tags"] == ["discontinued"]
+        assert metadata["total_count"] == 5
+        assert metadata["returned_count"] == 2
+        assert metadata["limit"] == 1000
+        assert metadata["cache_hit"] is True
+
+        params = mock_get_json_async.await_args.args[1]
+        assert params["tag_names"] == "slovenia;oecd"
+        assert params["exclude_tag_names"] == "discontinued"
+        assert params["limit"] == 1000
+
+    @patch(
+        "trabajo_ia_server.utils.fred_client.fred_client.get_json_async",
+        new_callable=AsyncMock,
+    )
+    @patch("trabajo_ia_server.config.config.get_fred_api_key")
+    def test_reports_api_errors(self, mock_get_key, mock_get_json_async):
+        mock_get_key.return_value = "test_api_key"
+        mock_get_json_async.side_effect = FredAPIError(
+            "Rate limit exceeded", status_code=429, retryable=True
+        )
+
+        result_data = json.loads(asyncio.run(aget_series_by_tags("gdp")))
+
+        assert "error" in result_data
+        assert result_data["tool"] == "get_series_by_tags"
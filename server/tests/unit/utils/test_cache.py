@@ -1,8 +1,16 @@
 """Unit tests for cache manager and in-memory backend."""
 
 import time
-
-from trabajo_ia_server.utils.cache import CacheManager, InMemoryCache
+import types
+
+from trabajo_ia_server.config import config
+from trabajo_ia_server.utils import cache as cache_module
+from trabajo_ia_server.utils.cache import (
+    CacheboxBackend,
+    CacheManager,
+    InMemoryCache,
+    _build_cache_manager,
+)
 from trabajo_ia_server.utils.metrics import metrics
 
 
@@ -59,3 +67,148 @@ def test_cache_manager_disabled_namespace():
     value, hit = manager.get("disabled", "key")
     assert hit is False
     assert value is None
+
+
+def test_cache_manager_invalidate_namespace_is_isolated():
+    metrics.reset()
+    backend = InMemoryCache(default_ttl=60)
+    manager = CacheManager(backend=backend, enabled=True, default_ttl=60)
+
+    manager.set("search", "key", "a")
+    manager.set("tags", "key", "b")
+    manager.invalidate_namespace("search")
+
+    assert manager.get("search", "key") == (None, False)
+    assert manager.get("tags", "key") == ("b", True)
+
+
+def test_in_memory_cache_sweeps_expired_entries_without_reads():
+    backend = InMemoryCache(default_ttl=60)
+    backend.set_in("one_off", "stale", "value", ttl=1)
+    backend.set_in("one_off", "fresh", "value", ttl=60)
+
+    removed = backend.sweep_expired(now=time.monotonic() + 5)
+
+    assert removed == 1
+    assert "stale" not in backend._shards["one_off"].entries
+    assert backend.get_in("one_off", "fresh") == "value"
+
+
+def test_in_memory_cache_bounds_namespace_with_lru_eviction():
+    backend = InMemoryCache(default_ttl=60, max_entries=2)
+    backend.set_in("ns", "a", 1)
+    backend.set_in("ns", "b", 2)
+    assert backend.get_in("ns", "a") == 1  # "b" becomes least recently used
+
+    backend.set_in("ns", "c", 3)
+
+    assert backend.get_in("ns", "b") is None
+    assert backend.get_in("ns", "a") == 1
+    assert backend.get_in("ns", "c") == 3
+
+
+def test_in_memory_cache_clear_resets_expiry_heap():
+    backend = InMemoryCache(default_ttl=60)
+    backend.set_in("ns", "a", 1)
+    backend.set_in("ns", "b", 2)
+
+    backend.clear()
+
+    assert backend._expiry_heap == []
+
+
+def test_in_memory_cache_compacts_stale_expiry_records():
+    backend = InMemoryCache(default_ttl=60)
+    for _ in range(10):
+        for index in range(50):
+            backend.set_in("ns", f"key-{index}", index)
+
+    # Overwrites leave stale deadlines behind until the heap is rebuilt.
+    assert len(backend._expiry_heap) <= 2 * 50 + backend.sweep_batch_size
+
+    backend.clear_namespace("ns")
+    for index in range(300):
+        backend.set_in("other", f"key-{index}", index)
+
+    assert len(backend._expiry_heap) <= 2 * 300 + backend.sweep_batch_size
+    assert backend.get_in("other", "key-0") == 0
+
+
+class _StubVTTLCache:
+    """Minimal stand-in for ``cachebox.VTTLCache`` with per-entry deadlines."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.ttls = {}
+        self._data = {}
+
+    def insert(self, key, value, ttl):
+        self.ttls[key] = ttl
+        deadline = None if ttl is None else time.monotonic() + ttl
+        self._data[key] = (value, deadline)
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        value, deadline = item
+        if deadline is not None and deadline <= time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def pop(self, key, default=None):
+        item = self._data.pop(key, None)
+        return default if item is None else item[0]
+
+    def keys(self):
+        return list(self._data)
+
+
+def _stub_cachebox(monkeypatch):
+    monkeypatch.setattr(
+        cache_module, "cachebox", types.SimpleNamespace(VTTLCache=_StubVTTLCache)
+    )
+
+
+def test_cachebox_backend_applies_per_entry_ttl(monkeypatch):
+    _stub_cachebox(monkeypatch)
+    backend = CacheboxBackend(default_ttl=60)
+
+    backend.set_in("ns", "default", "a")
+    backend.set_in("ns", "short", "b", ttl=1)
+    backend.set_in("ns", "skipped", "c", ttl=0)
+
+    shard = backend._shards["ns"]
+    assert shard.ttls == {"default": 60, "short": 1}
+    assert backend.get_with_hit("ns", "short") == ("b", True)
+    assert backend.get_with_hit("ns", "skipped") == (None, False)
+
+    time.sleep(1.1)
+
+    assert backend.get_with_hit("ns", "short") == (None, False)
+    assert backend.get_in("ns", "default") == "a"
+
+
+def test_cachebox_backend_clear_namespace_is_isolated(monkeypatch):
+    _stub_cachebox(monkeypatch)
+    backend = CacheboxBackend(default_ttl=60)
+    manager = CacheManager(backend=backend, enabled=True, default_ttl=60)
+
+    manager.set("search", "key", "a")
+    manager.set("tags", "key", "b")
+    backend.clear_namespace("search")
+
+    assert manager.get("search", "key") == (None, False)
+    assert manager.get("tags", "key") == ("b", True)
+
+
+def test_cachebox_backend_falls_back_to_in_memory_when_missing(monkeypatch):
+    monkeypatch.setattr(cache_module, "cachebox", None)
+    monkeypatch.setattr(config, "CACHE_ENABLED", True)
+    monkeypatch.setattr(config, "CACHE_BACKEND", "cachebox")
+
+    manager = _build_cache_manager()
+
+    assert isinstance(manager.backend, InMemoryCache)
+    assert manager.enabled is True
@@ -1,5 +1,7 @@
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from trabajo_ia_server.utils.cache import CacheManager, InMemoryCache
@@ -39,6 +41,18 @@ def mock_response(payload, *, url="https://example.com", status=200, headers=Non
     return response
 
 
+def mock_async_client(*responses):
+    async_client = MagicMock(spec=httpx.AsyncClient)
+    async_client.get = AsyncMock(side_effect=list(responses))
+    return async_client
+
+
+def httpx_response(payload, *, url="https://example.com", status=200, headers=None):
+    return httpx.Response(
+        status, json=payload, headers=headers, request=httpx.Request("GET", url)
+    )
+
+
 def test_fred_client_caches_successful_responses():
     client = build_client()
     payload = {"seriess": [], "count": 0}
@@ -69,6 +83,20 @@ def test_fred_client_does_not_cache_error_payloads():
     assert client._rate_limiter.acquisitions == 2
 
 
+def test_fred_client_skips_cache_key_for_disabled_namespace():
+    client = build_client()
+    client._cache.configure_namespace("uncached", 0)
+    response = mock_response({"seriess": []})
+
+    with patch.object(client._session, "get", return_value=response) as mock_get, patch.object(
+        client, "_build_cache_key"
+    ) as mock_key:
+        client.get_json("https://example.com", {}, namespace="uncached")
+        client.get_json("https://example.com", {}, namespace="uncached")
+        assert mock_get.call_count == 2
+        mock_key.assert_not_called()
+
+
 def test_fred_client_cache_errors_when_requested():
     client = build_client()
     error_payload = {"error_code": 500, "error_message": "fail"}
@@ -113,6 +141,146 @@ def test_fred_client_registers_rate_limit_penalty(_mock_time, mock_sleep):
         with pytest.raises(FredAPIError):
             client.get_json("https://example.com", {}, namespace="test", ttl=10)
 
-    assert mock_get.call_count == 1
+    assert mock_get.call_count == client._max_attempts
     assert rate_limiter.penalties[0] == pytest.approx(5.0, rel=0.01)
     mock_sleep.assert_called()
+
+
+def test_fred_client_batch_get_preserves_order():
+    client = build_client()
+
+    async def fake_get_json_async(url, params, **kwargs):
+        return url
+
+    with patch.object(client, "get_json_async", side_effect=fake_get_json_async):
+        results = asyncio.run(
+            client.batch_get([("https://a", {}), ("https://b", {})], namespace="test")
+        )
+
+    assert results == ["https://a", "https://b"]
+
+
+def test_fred_client_compresses_cached_payloads_for_configured_namespaces():
+    metrics.reset()
+    cache = CacheManager(backend=InMemoryCache(default_ttl=30), enabled=True, default_ttl=30)
+    client = FredClient(
+        cache=cache,
+        timeout=0.1,
+        rate_limiter=DummyRateLimiter(),
+        compressed_namespaces=["observations"],
+    )
+    payload = {"observations": [{"date": "2020-01-01", "value": "1.0"}]}
+    response = mock_response(payload)
+
+    with patch.object(client._session, "get", return_value=response) as mock_get:
+        client.get_json("https://example.com", {}, namespace="observations", ttl=10)
+        second = client.get_json("https://example.com", {}, namespace="observations", ttl=10)
+        assert mock_get.call_count == 1
+
+    assert second.from_cache is True
+    assert second.json() == payload
+    stored, hit = cache.get("observations", "https://example.com")
+    assert hit is True
+    assert isinstance(stored.body, bytes)
+
+
+def test_fred_client_async_caches_successful_responses():
+    client = build_client()
+    payload = {"seriess": [], "count": 0}
+    async_client = mock_async_client(httpx_response(payload))
+
+    async def fetch_twice():
+        first = await client.get_json_async(
+            "https://example.com", {"q": "1"}, namespace="test", ttl=10
+        )
+        second = await client.get_json_async(
+            "https://example.com", {"q": "1"}, namespace="test", ttl=10
+        )
+        return first, second
+
+    with patch.object(client, "_get_async_client", return_value=async_client):
+        first, second = asyncio.run(fetch_twice())
+
+    assert first.from_cache is False
+    assert first.json() == payload
+    assert second.from_cache is True
+    assert async_client.get.await_count == 1
+    assert client._rate_limiter.acquisitions == 1
+
+
+def test_fred_client_async_misses_cache_for_different_params():
+    client = build_client()
+    async_client = mock_async_client(
+        httpx_response({"count": 1}), httpx_response({"count": 2})
+    )
+
+    async def fetch_both():
+        first = await client.get_json_async(
+            "https://example.com", {"q": "1"}, namespace="test", ttl=10
+        )
+        second = await client.get_json_async(
+            "https://example.com", {"q": "2"}, namespace="test", ttl=10
+        )
+        return first, second
+
+    with patch.object(client, "_get_async_client", return_value=async_client):
+        first, second = asyncio.run(fetch_both())
+
+    assert first.json() == {"count": 1}
+    assert second.json() == {"count": 2}
+    assert second.from_cache is False
+    assert async_client.get.await_count == 2
+
+
+@patch("trabajo_ia_server.utils.fred_client.asyncio.sleep", new_callable=AsyncMock)
+@patch("trabajo_ia_server.utils.fred_client.time.time", return_value=10)
+def test_fred_client_async_retries_after_rate_limit_penalty(_mock_time, mock_sleep):
+    rate_limiter = DummyRateLimiter()
+    client = build_client(rate_limiter=rate_limiter)
+    payload = {"seriess": [{"id": "GDP"}]}
+    async_client = mock_async_client(
+        httpx_response({}, status=429, headers={"X-RateLimit-Reset": "15"}),
+        httpx_response(payload),
+    )
+
+    with patch.object(client, "_get_async_client", return_value=async_client):
+        response = asyncio.run(
+            client.get_json_async("https://example.com", {}, namespace="test", ttl=10)
+        )
+
+    assert response.json() == payload
+    assert async_client.get.await_count == 2
+    assert rate_limiter.acquisitions == 2
+    assert rate_limiter.penalties == [pytest.approx(5.0, rel=0.01)]
+    mock_sleep.assert_any_await(pytest.approx(5.0, rel=0.01))
+
+
+def test_fred_client_cache_key_distinguishes_equal_values_of_different_types():
+    keys = [
+        FredClient._build_cache_key("https://example.com", {"flag": value})
+        for value in (True, 1, 1.0)
+    ]
+
+    assert keys == [
+        "https://example.com?flag=True",
+        "https://example.com?flag=1",
+        "https://example.com?flag=1.0",
+    ]
+
+
+def test_fred_client_keeps_one_async_client_per_event_loop():
+    client = build_client()
+
+    async def get_clients():
+        first = client._get_async_client()
+        second = client._get_async_client()
+        await client.aclose()
+        return first, second
+
+    first_loop = asyncio.run(get_clients())
+    second_loop = asyncio.run(get_clients())
+
+    assert first_loop[0] is first_loop[1]
+    assert second_loop[0] is not first_loop[0]
+    assert first_loop[0].is_closed
+    assert len(client._async_clients) == 0
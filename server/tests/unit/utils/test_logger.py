@@ -0,0 +1,32 @@
+"""Tests for logger handler attachment and propagation."""
+
+import io
+import logging
+
+from trabajo_ia_server.utils.logger import setup_logger
+
+
+def test_setup_logger_child_propagates_without_duplicate_handler():
+    parent = logging.getLogger("test_propagation_parent")
+    parent.handlers.clear()
+    stream = io.StringIO()
+    parent.addHandler(logging.StreamHandler(stream))
+    parent.setLevel(logging.INFO)
+    try:
+        child = setup_logger("test_propagation_parent.child", level="INFO")
+        child.info("emitted once")
+    finally:
+        parent.handlers.clear()
+
+    assert child.propagate is True
+    assert child.handlers == []
+    assert stream.getvalue().count("emitted once") == 1
+
+
+def test_setup_logger_records_reach_caplog(caplog):
+    logger = setup_logger("test_propagation_caplog", level="INFO")
+
+    with caplog.at_level(logging.INFO, logger="test_propagation_caplog"):
+        logger.info("visible to caplog")
+
+    assert "visible to caplog" in caplog.text
@@ -1,3 +1,6 @@
+import sys
+import threading
+
 from trabajo_ia_server.utils.metrics import MetricsRegistry
 
 
@@ -27,3 +30,51 @@ def test_metrics_registry_tracks_counters_and_histograms():
     registry.reset()
     cleared = registry.export()
     assert cleared["counters"] == {}
+
+
+def test_disabled_registry_ignores_writes_until_reenabled():
+    registry = MetricsRegistry(enabled=False)
+
+    registry.increment("requests_total", labels={"status": "200"})
+    registry.set_gauge("inflight_requests", 1)
+    registry.observe("latency_seconds", 0.5)
+    assert registry.export() == {"counters": {}, "gauges": {}, "histograms": {}}
+
+    registry.enabled = True
+    registry.increment("requests_total")
+    assert registry.export()["counters"]["requests_total"]["()"] == 1.0
+
+
+def test_metrics_registry_counts_exactly_across_threads():
+    registry = MetricsRegistry(enabled=True)
+    threads_count = 8
+    increments = 50_000
+
+    def worker():
+        for _ in range(increments):
+            registry.increment("requests_total", labels={"status": "200"})
+
+    threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+    # Switch threads often so a non-atomic update would lose increments.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    counters = registry.export()["counters"]["requests_total"]
+    assert counters["(('status', '200'),)"] == float(threads_count * increments)
+
+
+def test_metrics_registry_keeps_equal_label_values_of_different_types_apart():
+    registry = MetricsRegistry(enabled=True)
+
+    registry.increment("requests_total", labels={"flag": True})
+    registry.increment("requests_total", labels={"flag": 1})
+
+    counters = registry.export()["counters"]["requests_total"]
+    assert counters == {"(('flag', 'True'),)": 1.0, "(('flag', '1'),)": 1.0}
@@ -0,0 +1,16 @@
+from trabajo_ia_server.utils.validators import validate_date_format
+
+
+def test_validate_date_format_accepts_unpadded_month_and_day():
+    assert validate_date_format("2024-01-05") is True
+    assert validate_date_format("2024-1-5") is True
+    assert validate_date_format("2024-12-31") is True
+    assert validate_date_format(None) is True
+
+
+def test_validate_date_format_rejects_invalid_dates():
+    assert validate_date_format("2024-02-30") is False
+    assert validate_date_format("2024-13-01") is False
+    assert validate_date_format("2024-001-05") is False
+    assert validate_date_format("24-01-05") is False
+    assert validate_date_format("2024/01/05") is False
@@ -16,9 +16,17 @@ from trabajo_ia_server.workflows.utils.gdp_validators import (
     validate_countries,
     validate_date_range
 )
+from trabajo_ia_server.utils.fred_client import fred_client
 from trabajo_ia_server.workflows.analyze_gdp import analyze_gdp_cross_country
 
 
+@pytest.fixture(autouse=True)
+def single_fred_attempt():
+    """Make one attempt per request so stubbed-network failures skip retry backoff."""
+    with patch.object(fred_client, "_max_attempts", 1):
+        yield
+
+
 class TestGDPMappings:
     """Test GDP mappings and presets."""
     